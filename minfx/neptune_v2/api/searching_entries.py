@@ -17,6 +17,8 @@ from __future__ import annotations
 
 __all__ = ["get_single_page", "iter_over_pages"]
 
+import queue
+import threading
 from typing import (
     TYPE_CHECKING,
     Generator,
@@ -48,6 +50,9 @@ if TYPE_CHECKING:
 
 SUPPORTED_ATTRIBUTE_TYPES = {item.value for item in AttributeType}
 
+# Pages fetched ahead of the consumer by iter_over_pages
+PREFETCH_PAGES = 2
+
 SORT_BY_COLUMN_TYPE: TypeAlias = Literal["string", "datetime", "integer", "boolean", "float"]
 
 
@@ -195,6 +200,84 @@ def iter_over_pages(
     max_offset: int = MAX_SERVER_OFFSET,
     **kwargs: object,
 ) -> Generator[LeaderboardEntry, None, None]:
+    """Yield leaderboard entries page by page, fetching up to PREFETCH_PAGES pages ahead.
+
+    Pages are requested on a background thread, so the next page's round-trip overlaps with
+    the caller processing the current one.
+    """
+    pages = _iter_pages(
+        step_size=step_size,
+        limit=limit,
+        offset=offset,
+        sort_by=sort_by,
+        sort_by_column_type=sort_by_column_type,
+        ascending=ascending,
+        progress_bar=progress_bar,
+        max_offset=max_offset,
+        **kwargs,
+    )
+    for page in _prefetch_pages(pages, depth=PREFETCH_PAGES):
+        yield from page
+
+
+def _prefetch_pages(
+    pages: Generator[list[LeaderboardEntry], None, None], depth: int
+) -> Generator[list[LeaderboardEntry], None, None]:
+    """Drive `pages` on a worker thread, keeping at most `depth` fetched pages buffered.
+
+    Errors from the page generator are re-raised in the consumer. If the consumer stops early,
+    the worker stops fetching and closes the page generator itself.
+    """
+    buffer: queue.Queue[tuple[list[LeaderboardEntry] | None, BaseException | None]] = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def put(item: tuple[list[LeaderboardEntry] | None, BaseException | None]) -> bool:
+        # Bounded waits, so a consumer that went away cannot leave the worker blocked forever
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    return
+            put((None, None))  # End of pages
+        except BaseException as e:
+            put((None, e))
+        finally:
+            pages.close()
+
+    worker = threading.Thread(target=produce, name="leaderboard_prefetch", daemon=True)
+    worker.start()
+    try:
+        while True:
+            page, error = buffer.get()
+            if error is not None:
+                raise error
+            if page is None:
+                return
+            yield page
+    finally:
+        stopped.set()
+
+
+def _iter_pages(
+    *,
+    step_size: int,
+    limit: int | None,
+    offset: int,
+    sort_by: str,
+    sort_by_column_type: SORT_BY_COLUMN_TYPE,
+    ascending: bool,
+    progress_bar: ProgressBarType | None,
+    max_offset: int,
+    **kwargs: object,
+) -> Generator[list[LeaderboardEntry], None, None]:
     searching_after = None
     last_page = None
 
@@ -263,7 +346,7 @@ def iter_over_pages(
                 if not page:
                     return
 
-                yield from page
+                yield page
 
                 if extracted_records == limit:
                     return
@@ -1278,6 +1278,9 @@ class NeptuneMultiBackendClosedError(NeptuneMultiBackendError):
 class BackendError(NeptuneMultiBackendError):
     """Error from a specific backend in a multi-backend setup."""
 
+    # Built per failed backend on every failed fan-out; slots keep these fields out of a per-instance dict
+    __slots__ = ("backend_index", "cause")
+
     def __init__(self, backend_index: int, cause: Exception) -> None:
         self.backend_index = backend_index
         self.cause = cause
@@ -26,6 +26,7 @@ from minfx.neptune_v2.exceptions import (
     NeptuneUnhandledArtifactSchemeException,
     NeptuneUnhandledArtifactTypeException,
 )
+from minfx.neptune_v2.internal.utils import DATACLASS_SLOTS
 
 if typing.TYPE_CHECKING:
     import pathlib
@@ -62,7 +63,7 @@ class ArtifactFileDTO(typing.Protocol):
     def metadata(self) -> list[object]: ...
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ArtifactFileData:
     file_path: str
     file_hash: str
@@ -77,9 +78,7 @@ class ArtifactFileData:
             file_hash=artifact_file_dto.fileHash,
             type=artifact_file_dto.type,
             size=artifact_file_dto.size,
-            metadata=ArtifactMetadataSerializer.deserialize(
-                [{"key": str(m.key), "value": str(m.value)} for m in artifact_file_dto.metadata]  # type: ignore[attr-defined]
-            ),
+            metadata={str(m.key): str(m.value) for m in artifact_file_dto.metadata},  # type: ignore[attr-defined]
         )
 
     def to_dto(self) -> dict:
@@ -94,6 +93,7 @@ class ArtifactFileData:
 
 class ArtifactDriversMap:
     _implementations: list[type[ArtifactDriver]] = []
+    _implementations_by_type: dict[str, type[ArtifactDriver]] = {}
 
     @classmethod
     def match_path(cls, path: str) -> type[ArtifactDriver]:
@@ -105,16 +105,20 @@ class ArtifactDriversMap:
 
     @classmethod
     def match_type(cls, type_str: str) -> type[ArtifactDriver]:
-        for artifact_driver in cls._implementations:
-            if artifact_driver.get_type() == type_str:
-                return artifact_driver
-
-        raise NeptuneUnhandledArtifactTypeException(type_str)
+        try:
+            return cls._implementations_by_type[type_str]
+        except KeyError:
+            raise NeptuneUnhandledArtifactTypeException(type_str) from None
 
 
 class ArtifactDriver(abc.ABC):
     def __init_subclass__(cls):
         ArtifactDriversMap._implementations.append(cls)
+        try:
+            # first registered driver wins, as with the previous linear scan
+            ArtifactDriversMap._implementations_by_type.setdefault(cls.get_type(), cls)
+        except NotImplementedError:
+            pass
 
     @staticmethod
     def get_type() -> str:
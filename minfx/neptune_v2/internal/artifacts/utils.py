@@ -18,21 +18,58 @@ from __future__ import annotations
 __all__ = ["sha1"]
 
 import hashlib
+import mmap
 from pathlib import Path
 import typing
 
+from minfx.neptune_v2.internal.utils.requirement_check import require_installed
+
 if typing.TYPE_CHECKING:
     import pathlib
 
+# 1 MiB keeps the working set within L2 while cutting read syscalls 16x vs. 64 KiB blocks.
+DEFAULT_BLOCK_SIZE = 2**20
+
+
+def _new_digest(algorithm: str) -> typing.Any:
+    if algorithm == "blake3":
+        require_installed("blake3")
+        import blake3
+
+        return blake3.blake3()
+    return hashlib.new(algorithm)
 
-def sha1(fname: str | pathlib.Path, block_size: int = 2**16) -> str:
-    sha1sum = hashlib.sha1()
+
+def sha1(fname: str | pathlib.Path, block_size: int = DEFAULT_BLOCK_SIZE, algorithm: str = "sha1") -> str:
+    """Returns the hex digest of a file's contents.
+
+    Defaults to SHA-1, which is what the server expects for artifact file hashes. Other `hashlib`
+    algorithms (e.g. "sha256") or "blake3" (requires the `blake3` package) can be selected for
+    local-only uses.
+
+    `block_size` is the chunk size fed to the digest. On Python 3.11+ with the default block size,
+    hashing is delegated to `hashlib.file_digest`, which picks its own buffer size; passing any
+    other block size uses the chunked path so the argument is honoured.
+    """
+    digest = _new_digest(algorithm)
 
     with Path(fname).open("rb") as source:
-        block = source.read(block_size)
+        if algorithm != "blake3" and block_size == DEFAULT_BLOCK_SIZE and hasattr(hashlib, "file_digest"):
+            # Python 3.11+: hashing loop runs in C without per-block Python overhead
+            return str(hashlib.file_digest(source, lambda: digest).hexdigest())
 
-        while len(block) != 0:
-            sha1sum.update(block)
+        try:
+            mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files and non-regular files cannot be mapped
             block = source.read(block_size)
 
-    return str(sha1sum.hexdigest())
+            while len(block) != 0:
+                digest.update(block)
+                block = source.read(block_size)
+        else:
+            with mapped, memoryview(mapped) as view:
+                for offset in range(0, len(view), block_size):
+                    digest.update(view[offset : offset + block_size])
+
+    return str(digest.hexdigest())
@@ -20,6 +20,9 @@ from __future__ import annotations
 __all__ = [
     "BackendConfig",
     "all_backends_have_projects",
+    "configs_from_env",
+    "configs_from_token_list",
+    "configs_from_token_string",
     "configs_from_tokens",
     "get_first_backend_project",
     "parse_api_tokens",
@@ -27,18 +30,21 @@ __all__ = [
 ]
 
 import os
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 
 from minfx.neptune_v2.common.envs import API_TOKEN_ENV_NAME
 from minfx.neptune_v2.exceptions import (
     NeptuneDuplicateBackendError,
     NeptuneMissingApiTokenException,
 )
+from minfx.neptune_v2.internal.utils import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class BackendConfig:
-    """Configuration for a single backend connection.
+    """Configuration for a single backend connection. Immutable once created.
 
     Attributes:
         api_token: The API token for authenticating with the backend.
@@ -75,8 +81,24 @@ def parse_api_tokens(api_token: str | None) -> list[str]:
     if api_token is None:
         raise NeptuneMissingApiTokenException()
 
-    tokens = [t.strip() for t in api_token.split(",")]
-    return [t for t in tokens if t]  # Filter empty strings
+    return list(_split_api_tokens(api_token))
+
+
+@lru_cache(maxsize=16)
+def _split_api_tokens(api_token: str) -> tuple[str, ...]:
+    """Split a raw token string, memoized on the string itself.
+
+    The environment is still read on every call, so a changed NEPTUNE_API_TOKEN is picked up;
+    only the parsing of an already-seen value is skipped. Tokens are interned, so the same token
+    reaching us through different configs is one object and compares by identity.
+    """
+    if "," not in api_token:
+        # Single token: the common case
+        token = api_token.strip()
+        return (sys.intern(token),) if token else ()
+    return tuple(
+        sys.intern(token) for token in (t.strip() for t in api_token.split(",")) if token  # Filter empty strings
+    )
 
 
 def configs_from_tokens(
@@ -86,6 +108,9 @@ def configs_from_tokens(
 ) -> list[BackendConfig]:
     """Create BackendConfig list from tokens.
 
+    Callers that know the input's type can use configs_from_token_string, configs_from_token_list
+    or configs_from_env directly.
+
     Args:
         api_tokens: Either a comma-separated string, a list of tokens, or None.
         proxies: Optional proxy configuration to apply to all backends.
@@ -94,14 +119,37 @@ def configs_from_tokens(
     Returns:
         List of BackendConfig objects, one per token.
     """
+    if api_tokens is None:
+        return configs_from_env(proxies=proxies, project=project)
     if isinstance(api_tokens, str):
-        tokens = parse_api_tokens(api_tokens)
-    elif api_tokens is None:
-        tokens = parse_api_tokens(None)
-    else:
-        tokens = api_tokens
+        return configs_from_token_string(api_tokens, proxies=proxies, project=project)
+    return configs_from_token_list(api_tokens, proxies=proxies, project=project)
 
-    return [BackendConfig(api_token=token, proxies=proxies, project=project) for token in tokens]
+
+def configs_from_token_string(
+    api_tokens: str,
+    proxies: dict[str, str] | None = None,
+    project: str | None = None,
+) -> list[BackendConfig]:
+    """Create BackendConfig list from a comma-separated token string."""
+    return configs_from_token_list(parse_api_tokens(api_tokens), proxies=proxies, project=project)
+
+
+def configs_from_token_list(
+    api_tokens: list[str],
+    proxies: dict[str, str] | None = None,
+    project: str | None = None,
+) -> list[BackendConfig]:
+    """Create BackendConfig list from already separated tokens."""
+    return [BackendConfig(api_token=token, proxies=proxies, project=project) for token in api_tokens]
+
+
+def configs_from_env(
+    proxies: dict[str, str] | None = None,
+    project: str | None = None,
+) -> list[BackendConfig]:
+    """Create BackendConfig list from the NEPTUNE_API_TOKEN environment variable."""
+    return configs_from_token_list(parse_api_tokens(None), proxies=proxies, project=project)
 
 
 def validate_backends_unique(backends: list[BackendConfig]) -> None:
@@ -120,6 +168,14 @@ def validate_backends_unique(backends: list[BackendConfig]) -> None:
     Raises:
         NeptuneDuplicateBackendError: If duplicate backends are detected.
     """
+    if len(backends) < 2:
+        return
+
+    unique_tokens = dict.fromkeys(config.api_token for config in backends)
+    if len(unique_tokens) == len(backends):
+        return
+
+    # Slow path, only taken when a duplicate exists: locate it for the error message
     seen_tokens: set[str] = set()
     for i, config in enumerate(backends):
         if config.api_token in seen_tokens:
@@ -138,7 +194,10 @@ def all_backends_have_projects(backends: list[BackendConfig] | None) -> bool:
     """
     if not backends:
         return False
-    return all(config.project is not None for config in backends)
+    for config in backends:
+        if config.project is None:
+            return False
+    return True
 
 
 def get_first_backend_project(backends: list[BackendConfig] | None) -> str | None:
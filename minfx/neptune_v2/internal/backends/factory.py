@@ -17,19 +17,33 @@ from __future__ import annotations
 
 __all__ = ["get_backend"]
 
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import logging
+import sys
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+)
 
-from minfx.neptune_v2.exceptions import AllBackendsFailedError, BackendError
+from minfx.neptune_v2.exceptions import (
+    AllBackendsFailedError,
+    BackendError,
+)
 from minfx.neptune_v2.internal.backends.backend_config import (
     BackendConfig,
-    configs_from_tokens,
+    configs_from_env,
+    validate_backends_unique,
 )
 from minfx.neptune_v2.internal.credentials import Credentials
 from minfx.neptune_v2.internal.utils.logger import get_logger
 from minfx.neptune_v2.types.mode import Mode
 
 from .hosted_neptune_backend import HostedNeptuneBackend
-from .multi_backend import MultiBackend
+from .multi_backend import (
+    MAX_PARALLEL_WORKERS,
+    MultiBackend,
+)
 from .neptune_backend_mock import NeptuneBackendMock
 from .offline_neptune_backend import OfflineNeptuneBackend
 
@@ -60,22 +74,40 @@ def get_backend(
         NeptuneBackend: Always returns a MultiBackend wrapping the configured backends.
     """
     # Debug and offline modes don't need real backends
-    if mode == Mode.DEBUG:
-        return NeptuneBackendMock()
-    if mode == Mode.OFFLINE:
-        return OfflineNeptuneBackend()
+    if mode in _LOCAL_MODES:
+        return _BACKEND_CREATORS[mode]()
 
     # If backends not provided, create from NEPTUNE_API_TOKEN env var
     if backends is None:
-        backends = configs_from_tokens(None, proxies=proxies)
+        configs, credentials = _configs_and_credentials_from_env(proxies=proxies)
+        return _get_backend_from_configs(mode=mode, configs=configs, proxies=proxies, credentials=credentials)
 
     return _get_backend_from_configs(mode=mode, configs=backends, proxies=proxies)
 
 
+def _configs_and_credentials_from_env(
+    proxies: dict | None = None,
+) -> tuple[list[BackendConfig], list[Credentials | None]]:
+    """Like configs_from_env, but also decodes each token's credentials in the same pass.
+
+    A token that fails to decode gets None, so the error surfaces from _create_single_backend
+    with the usual per-backend handling.
+    """
+    configs = configs_from_env(proxies=proxies)
+    credentials: list[Credentials | None] = []
+    for config in configs:
+        try:
+            credentials.append(_credentials_from_token(config.api_token))
+        except Exception:
+            credentials.append(None)
+    return configs, credentials
+
+
 def _get_backend_from_configs(
     mode: Mode,
     configs: list[BackendConfig],
     proxies: dict | None = None,
+    credentials: list[Credentials | None] | None = None,
 ) -> NeptuneBackend:
     """Create backend(s) from a list of BackendConfig objects.
 
@@ -83,19 +115,21 @@ def _get_backend_from_configs(
 
     Handles backend creation failures gracefully:
     - For single backend: exception propagates normally.
-    - For multiple backends: logs a warning and continues if some fail.
+    - For multiple backends: connects in parallel, logs a warning and continues if some fail.
     - Only raises AllBackendsFailedError if ALL backends fail to create.
 
     Args:
         mode: Connection mode.
         configs: List of BackendConfig objects.
         proxies: Default proxy configuration (used if config doesn't specify proxies).
+        credentials: Optional credentials already decoded from configs, by position.
 
     Returns:
         NeptuneBackend: Always returns a MultiBackend wrapping the configured backends.
 
     Raises:
         ValueError: If no backend configurations provided.
+        NeptuneDuplicateBackendError: If two configs share an API token.
         AllBackendsFailedError: If all backends fail to create.
     """
     if not configs:
@@ -104,56 +138,86 @@ def _get_backend_from_configs(
     total_backends = len(configs)
     is_multi = total_backends > 1
 
-    if is_multi:
-        logger.info(f"Connecting to {total_backends} backends...")
+    def connect(index: int) -> NeptuneBackend:
+        config = configs[index]
+        return _create_single_backend(
+            mode=mode,
+            api_token=config.api_token,
+            credentials=credentials[index] if credentials is not None else None,
+            proxies=config.proxies or proxies,
+            project_name_override=config.project,
+            backend_index=index,  # Always pass index for queue size tracking
+        )
 
-    backends: list[tuple[int, NeptuneBackend]] = []  # (original_index, backend) pairs
-    creation_errors: list[BackendError] = []
+    if not is_multi:
+        # Single backend: connect inline and let exceptions propagate
+        return MultiBackend.from_parallel_lists([0], [connect(0)])
 
+    # Duplicates must fail before any connection is attempted
+    validate_backends_unique(configs)
+
+    urls: list[str] = []
     for index, config in enumerate(configs):
-        effective_proxies = config.proxies or proxies
-        role_marker = "(primary)" if index == 0 else "(secondary)"
+        config_credentials = credentials[index] if credentials is not None else None
+        if config_credentials is not None:
+            urls.append(config_credentials.api_address)
+        else:
+            urls.append(_get_url_from_token(config.api_token))
 
-        # Extract URL from token for logging before connection attempt
-        backend_url = _get_url_from_token(config.api_token)
+    # Skip building per-backend info lines when INFO is filtered out
+    info_enabled = logger.isEnabledFor(logging.INFO)
 
-        if is_multi:
-            logger.info(f"[backend {index}] ({backend_url}): connecting {role_marker}...")
+    if info_enabled:
+        logger.info(f"Connecting to {total_backends} backends...")
 
-        try:
-            backend = _create_single_backend(
-                mode=mode,
-                api_token=config.api_token,
-                proxies=effective_proxies,
-                project_name_override=config.project,
-                backend_index=index,  # Always pass index for queue size tracking
-            )
-            backends.append((index, backend))  # Preserve original index
-            if is_multi:
-                logger.info(f"[backend {index}] ({backend.get_display_address()}): connected {role_marker}")
-        except Exception as e:
-            if is_multi:
-                # Multi-backend: log warning and continue
-                error_type = type(e).__name__
+    # Original indices and backends as parallel lists, so failed backends keep others' numbering
+    connected_indices: list[int] = []
+    connected_backends: list[NeptuneBackend] = []
+    creation_errors: list[BackendError] = []
+
+    if info_enabled:
+        for index in range(total_backends):
+            role_marker = "(primary)" if index == 0 else "(secondary)"
+            logger.info(f"[backend {index}] ({urls[index]}): connecting {role_marker}...")
+
+    # Connection handshakes are independent, so overlap them; results are handled in index order
+    with ThreadPoolExecutor(
+        max_workers=min(total_backends, MAX_PARALLEL_WORKERS),
+        thread_name_prefix="backend_connect",
+    ) as executor:
+        futures = [executor.submit(connect, index) for index in range(total_backends)]
+
+        for index, future in enumerate(futures):
+            role_marker = "(primary)" if index == 0 else "(secondary)"
+            try:
+                backend = future.result()
+                connected_indices.append(index)  # Preserve original index
+                connected_backends.append(backend)
+                if info_enabled:
+                    logger.info(f"[backend {index}] ({backend.get_display_address()}): connected {role_marker}")
+            except Exception as e:
+                # Multi-backend: log warning and continue (formatted lazily by the handler)
                 logger.warning(
-                    f"[backend {index}] ({backend_url}): failed to connect {role_marker} - {error_type}: {e}"
+                    "[backend %d] (%s): failed to connect %s - %s: %s",
+                    index,
+                    urls[index],
+                    role_marker,
+                    type(e).__name__,
+                    e,
                 )
                 creation_errors.append(BackendError(backend_index=index, cause=e))
-            else:
-                # Single backend: propagate exception
-                raise
 
-    if not backends:
+    if not connected_backends:
         raise AllBackendsFailedError(creation_errors)
 
-    if is_multi:
-        if creation_errors:
-            logger.warning(f"Backend connection completed: {len(backends)}/{total_backends} backends ready")
-        else:
-            logger.info(f"Backend connection completed: {len(backends)}/{total_backends} backends ready")
+    connected_count = len(connected_backends)
+    if creation_errors:
+        logger.warning(f"Backend connection completed: {connected_count}/{total_backends} backends ready")
+    elif info_enabled:
+        logger.info(f"Backend connection completed: {connected_count}/{total_backends} backends ready")
 
     # Always return MultiBackend (even for single backend)
-    return MultiBackend.from_indexed_backends(backends)
+    return MultiBackend.from_parallel_lists(connected_indices, connected_backends)
 
 
 def _get_url_from_token(api_token: str | None) -> str:
@@ -161,18 +225,34 @@ def _get_url_from_token(api_token: str | None) -> str:
     if api_token is None:
         return "unknown"
     try:
-        creds = Credentials.from_token(api_token)
+        creds = _credentials_from_token(sys.intern(api_token))
         return creds.api_address
     except Exception:
         return "unknown"
 
 
+def _credentials_from_token(api_token: str | None) -> Credentials:
+    """Decode credentials from a token, reusing earlier decodes of the same token.
+
+    A None token falls through uncached, since it is resolved from the environment.
+    """
+    if api_token is None:
+        return Credentials.from_token(api_token=None)
+    return _decode_credentials(api_token)
+
+
+@lru_cache(maxsize=64)
+def _decode_credentials(api_token: str) -> Credentials:
+    return Credentials.from_token(api_token=api_token)
+
+
 def _create_single_backend(
     mode: Mode,
     api_token: str | None = None,
     proxies: dict | None = None,
     project_name_override: str | None = None,
     backend_index: int | None = None,
+    credentials: Credentials | None = None,
 ) -> NeptuneBackend:
     """Create a single backend instance based on mode.
 
@@ -183,16 +263,49 @@ def _create_single_backend(
         project_name_override: Optional project name to use instead of the main project.
             If specified, this backend will use this project for all operations.
         backend_index: Index of this backend for logging purposes (in multi-backend setups).
+        credentials: Credentials already decoded from api_token; decoded here if not given.
     """
-    if mode in (Mode.ASYNC, Mode.SYNC, Mode.READ_ONLY):
-        return HostedNeptuneBackend(
-            credentials=Credentials.from_token(api_token=api_token),
-            proxies=proxies,
-            project_name_override=project_name_override,
-            backend_index=backend_index,
-        )
-    if mode == Mode.DEBUG:
-        return NeptuneBackendMock()
-    if mode == Mode.OFFLINE:
-        return OfflineNeptuneBackend()
-    raise ValueError(f"mode should be one of {list(Mode)}")
+    try:
+        create_backend = _BACKEND_CREATORS[mode]
+    except KeyError:
+        raise ValueError(f"mode should be one of {list(Mode)}") from None
+    return create_backend(
+        api_token=api_token,
+        proxies=proxies,
+        project_name_override=project_name_override,
+        backend_index=backend_index,
+        credentials=credentials,
+    )
+
+
+def _create_hosted_backend(
+    api_token: str | None,
+    proxies: dict | None,
+    project_name_override: str | None,
+    backend_index: int | None,
+    credentials: Credentials | None,
+) -> NeptuneBackend:
+    return HostedNeptuneBackend(
+        credentials=credentials if credentials is not None else _credentials_from_token(api_token),
+        proxies=proxies,
+        project_name_override=project_name_override,
+        backend_index=backend_index,
+    )
+
+
+def _create_mock_backend(**_: object) -> NeptuneBackend:
+    return NeptuneBackendMock()
+
+
+def _create_offline_backend(**_: object) -> NeptuneBackend:
+    return OfflineNeptuneBackend()
+
+
+_HOSTED_MODES: frozenset[Mode] = frozenset({Mode.ASYNC, Mode.SYNC, Mode.READ_ONLY})
+_LOCAL_MODES: frozenset[Mode] = frozenset({Mode.DEBUG, Mode.OFFLINE})
+
+_BACKEND_CREATORS: dict[Mode, Callable[..., NeptuneBackend]] = {
+    **dict.fromkeys(_HOSTED_MODES, _create_hosted_backend),
+    Mode.DEBUG: _create_mock_backend,
+    Mode.OFFLINE: _create_offline_backend,
+}
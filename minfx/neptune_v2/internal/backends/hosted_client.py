@@ -33,6 +33,7 @@ from typing import (
 
 import requests as requests_lib
 from packaging.version import Version
+from requests.adapters import HTTPAdapter
 
 from bravado.requests_client import RequestsClient
 
@@ -64,6 +65,10 @@ LEADERBOARD_SWAGGER_PATH = "/api/leaderboard/swagger.json"
 ARTIFACTS_SWAGGER_PATH = "/api/artifacts/swagger.json"
 
 CONNECT_TIMEOUT = 30  # helps detecting internet connection lost
+# Upload, ping and fetch threads share one session per backend; requests' default of 10 pooled
+# connections per host makes them queue for a socket and re-handshake TLS once the pool overflows.
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
 REQUEST_TIMEOUT = int(os.getenv(NEPTUNE_REQUEST_TIMEOUT, "600"))
 
 DEFAULT_REQUEST_KWARGS = {
@@ -82,7 +87,10 @@ def _close_connections_on_fork(session: requests.Session):
 
 # WARNING: Be careful when changing this function. It is used in the experimental package
 def _set_pool_size(http_client: RequestsClient) -> None:
-    _ = http_client
+    # Retries stay with with_api_exceptions_handler, so the adapter keeps max_retries at its default (0)
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+    http_client.session.mount("https://", adapter)
+    http_client.session.mount("http://", adapter)
 
 
 def create_http_client(ssl_verify: bool, proxies: dict[str, str]) -> RequestsClient:
@@ -19,30 +19,38 @@ from __future__ import annotations
 
 __all__ = ["MultiBackend"]
 
+import functools
+import logging
 import threading
 import time
 from concurrent.futures import (
+    ALL_COMPLETED,
     ThreadPoolExecutor,
     TimeoutError as FuturesTimeoutError,
     as_completed,
+    wait,
 )
 from dataclasses import dataclass, field
 from typing import (
     TYPE_CHECKING,
+    Callable,
     Iterator,
+    NamedTuple,
     NoReturn,
+    TypeVar,
 )
 
+from minfx.neptune_v2.common.exceptions import NeptuneException
 from minfx.neptune_v2.exceptions import (
     AllBackendsFailedError,
     BackendError,
     NeptuneMultiBackendClosedError,
 )
 from minfx.neptune_v2.internal.backends.neptune_backend import NeptuneBackend
+from minfx.neptune_v2.internal.utils import DATACLASS_SLOTS
 from minfx.neptune_v2.internal.utils.logger import get_logger
 
 if TYPE_CHECKING:
-    from minfx.neptune_v2.common.exceptions import NeptuneException
     from minfx.neptune_v2.core.components.operation_storage import OperationStorage
     from minfx.neptune_v2.internal.backends.api_model import (
         ApiExperiment,
@@ -55,40 +63,52 @@ if TYPE_CHECKING:
 
 logger = get_logger()
 
+T = TypeVar("T")
+
 # Constants
 MAX_RETRY_TIMEOUT_SECONDS = 30
 HEALTH_CHECK_INTERVAL_SECONDS = 60
 MAX_PARALLEL_WORKERS = 10
 FAILURE_THRESHOLD = 3  # Failures before marking as degraded
 
+# Errors a read fails over on: Neptune API errors plus network/HTTP errors (requests and bravado
+# exceptions are OSErrors). Anything else is a bug in the caller or client and propagates as is.
+_FAILOVER_EXCEPTIONS = (NeptuneException, OSError)
+
 
 # =============================================================================
 # Backend Health States (Rust-style discriminated union)
 # =============================================================================
 # Each state variant carries exactly the data relevant to that state.
 # This prevents inconsistent states like "healthy with 5 failures".
+# Variants are NamedTuples: immutable, slotted and cheap to allocate, which matters because
+# every health transition allocates a new one. Compare variants with isinstance, never with ==,
+# since tuple equality ignores the variant type.
 
 
-@dataclass(frozen=True)
-class Healthy:
+class Healthy(NamedTuple):
     """Backend is operating normally."""
 
-    last_success_time: float
+    _routable = True
 
+    last_success_time: float  # When the backend (re)entered Healthy; not refreshed on every success
 
-@dataclass(frozen=True)
-class Failing:
+
+class Failing(NamedTuple):
     """Backend has failed 1-2 times consecutively, still routable."""
 
+    _routable = True
+
     consecutive_failures: int  # 1 or 2
     last_error: Exception
     last_success_time: float  # Preserved from before failures
 
 
-@dataclass(frozen=True)
-class Degraded:
+class Degraded(NamedTuple):
     """Backend has failed 3+ times, excluded from routing."""
 
+    _routable = False
+
     consecutive_failures: int  # >= 3
     last_error: Exception
 
@@ -99,7 +119,8 @@ BackendHealth = Healthy | Failing | Degraded
 
 def is_routable(health: BackendHealth) -> bool:
     """Check if backend should receive operations (Healthy or Failing)."""
-    return isinstance(health, (Healthy, Failing))
+    # Each variant carries its routability as a class attribute: one attribute load, no MRO walk
+    return health._routable
 
 
 # =============================================================================
@@ -107,13 +128,18 @@ def is_routable(health: BackendHealth) -> bool:
 # =============================================================================
 
 
-@dataclass
+@dataclass(eq=False, **DATACLASS_SLOTS)
 class BackendState:
-    """Tracks a single backend and its health state."""
+    """Tracks a single backend and its health state.
+
+    States live for the whole MultiBackend lifetime; health is swapped in place under the
+    state's own lock, so transitions on different backends never contend with each other.
+    """
 
     backend: NeptuneBackend
     index: int
     health: BackendHealth = field(default_factory=lambda: Healthy(last_success_time=time.time()))
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
 
 # =============================================================================
@@ -122,60 +148,127 @@ class BackendState:
 
 
 def compute_success_health() -> Healthy:
-    """Compute new health state after successful operation."""
+    """Compute new health state after successful operation.
+
+    Only called when a backend recovers; successes on an already Healthy backend skip it,
+    so the clock is read once per recovery rather than once per call.
+    """
     return Healthy(last_success_time=time.time())
 
 
-def compute_failure_health(current_health: BackendHealth, error: Exception) -> BackendHealth:
-    """Compute new health state after failed operation.
+def _failure_from_healthy(current_health: Healthy, error: Exception) -> BackendHealth:
+    # First failure: Healthy -> Failing(1)
+    return Failing(
+        consecutive_failures=1,
+        last_error=error,
+        last_success_time=current_health.last_success_time,
+    )
 
-    This is a pure function that computes the next state based on current state.
-    Must be called while holding the lock to ensure atomic read-modify-write.
-    """
-    if isinstance(current_health, Healthy):
-        # First failure: Healthy -> Failing(1)
+
+def _failure_from_failing(current_health: Failing, error: Exception) -> BackendHealth:
+    n = current_health.consecutive_failures
+    if n < FAILURE_THRESHOLD - 1:
+        # Still under threshold: Failing(n) -> Failing(n+1)
+        # With FAILURE_THRESHOLD=3, this matches n=1 only (n < 2)
+        # When n=2, falls through to the Degraded branch -> Degraded(3)
         return Failing(
-            consecutive_failures=1,
+            consecutive_failures=n + 1,
             last_error=error,
             last_success_time=current_health.last_success_time,
         )
-    elif isinstance(current_health, Failing):
-        n = current_health.consecutive_failures
-        if n < FAILURE_THRESHOLD - 1:
-            # Still under threshold: Failing(n) -> Failing(n+1)
-            # With FAILURE_THRESHOLD=3, this matches n=1 only (n < 2)
-            # When n=2, falls through to else branch -> Degraded(3)
-            return Failing(
-                consecutive_failures=n + 1,
-                last_error=error,
-                last_success_time=current_health.last_success_time,
-            )
-        else:
-            # Hit threshold: Failing(2) -> Degraded(3)
-            return Degraded(
-                consecutive_failures=n + 1,
-                last_error=error,
-            )
-    elif isinstance(current_health, Degraded):
-        # Already degraded: increment counter
-        return Degraded(
-            consecutive_failures=current_health.consecutive_failures + 1,
-            last_error=error,
-        )
-    # Should never reach here, but satisfy type checker
-    return Degraded(consecutive_failures=1, last_error=error)
+    # Hit threshold: Failing(2) -> Degraded(3)
+    return Degraded(
+        consecutive_failures=n + 1,
+        last_error=error,
+    )
+
+
+def _failure_from_degraded(current_health: Degraded, error: Exception) -> BackendHealth:
+    # Already degraded: increment counter
+    return Degraded(
+        consecutive_failures=current_health.consecutive_failures + 1,
+        last_error=error,
+    )
+
+
+# Keyed on the exact variant type: one dict probe instead of an isinstance chain
+_FAILURE_TRANSITIONS = {
+    Healthy: _failure_from_healthy,
+    Failing: _failure_from_failing,
+    Degraded: _failure_from_degraded,
+}
+
+
+def compute_failure_health(current_health: BackendHealth, error: Exception) -> BackendHealth:
+    """Compute new health state after failed operation.
+
+    This is a pure function that computes the next state based on current state.
+    Must be called while holding the backend state's lock to ensure atomic read-modify-write.
+    """
+    transition = _FAILURE_TRANSITIONS.get(type(current_health))
+    if transition is None:
+        # Should never reach here, but satisfy type checker
+        return Degraded(consecutive_failures=1, last_error=error)
+    return transition(current_health, error)
+
+
+def _failover_read_method(op: str) -> Callable:
+    """Build a MultiBackend method that forwards `op` through MultiBackend._failover_read."""
+
+    @functools.wraps(getattr(NeptuneBackend, op), updated=())  # Keep __isabstractmethod__ off
+    def method(self: MultiBackend, *args, **kwargs):
+        return self._failover_read(op, *args, **kwargs)
+
+    return method
+
+
+def _primary_method(op: str) -> Callable:
+    """Build a MultiBackend method that forwards `op` to the primary (first) backend."""
+
+    @functools.wraps(getattr(NeptuneBackend, op), updated=())  # Keep __isabstractmethod__ off
+    def method(self: MultiBackend, *args, **kwargs):
+        return getattr(self._backend_states[0].backend, op)(*args, **kwargs)
+
+    return method
+
+
+def _execute_on_backend(
+    state: BackendState,
+    container_id: UniqueId,
+    container_type: ContainerType,
+    operations: list[Operation],
+    operation_storage: OperationStorage,
+) -> tuple[int, tuple[int, list[NeptuneException]] | None, Exception | None]:
+    """Run one backend's share of MultiBackend.execute_operations; return (index, result, error).
+
+    Module-level so a flush does not build a new closure each call. Health transitions are left
+    to the caller, which applies them in one batch.
+    """
+    try:
+        result = state.backend.execute_operations(container_id, container_type, operations, operation_storage)
+        return (state.index, result, None)
+    except Exception as e:
+        return (state.index, None, e)
+
+
+_HEALTH_STATUS_FORMATTERS = {
+    Healthy: lambda health: "healthy",
+    Failing: lambda health: f"failing, {health.consecutive_failures} errors",
+    Degraded: lambda health: f"degraded, {health.consecutive_failures} errors",
+}
 
 
 class MultiBackend(NeptuneBackend):
     """Composite backend that fans out operations to multiple backends in parallel.
 
     Thread Safety:
-        This class is thread-safe. It uses an internal lock for state management
-        and integrates with the container's RLock passed via set_container_lock().
+        This class is thread-safe. Each BackendState has its own lock for health
+        transitions, an internal lock guards the cached routable view, and it
+        integrates with the container's RLock passed via set_container_lock().
 
         IMPORTANT: All state transitions are atomic - they read current state and
-        compute new state while holding the lock. This prevents race conditions
-        where concurrent failures could corrupt the consecutive_failures counter.
+        compute new state while holding that backend's state lock. This prevents race
+        conditions where concurrent failures could corrupt the consecutive_failures counter.
 
     Read Consistency:
         Read operations use first-available semantics. The first backend to respond
@@ -187,9 +280,11 @@ class MultiBackend(NeptuneBackend):
         """Create MultiBackend with sequential indices (0, 1, 2, ...).
 
         For backends with custom indices (e.g., when some backends failed to connect),
-        use from_indexed_backends() instead.
+        use from_parallel_lists() instead.
         """
-        self._backend_states: list[BackendState] = [BackendState(backend=b, index=i) for i, b in enumerate(backends)]
+        self._backend_states: tuple[BackendState, ...] = tuple(
+            BackendState(backend=b, index=i) for i, b in enumerate(backends)
+        )
         self._init_common(len(backends))
 
     @classmethod
@@ -202,29 +297,76 @@ class MultiBackend(NeptuneBackend):
         Args:
             indexed_backends: List of (original_index, backend) tuples.
         """
+        return cls.from_parallel_lists(
+            [idx for idx, _ in indexed_backends],
+            [backend for _, backend in indexed_backends],
+        )
+
+    @classmethod
+    def from_parallel_lists(cls, indices: list[int], backends: list[NeptuneBackend]) -> MultiBackend:
+        """Create MultiBackend with explicit indices given as two parallel lists.
+
+        Use this when some backends failed to connect and you want to preserve
+        the original numbering (e.g., if backend #1 fails, keep #0 and #2).
+
+        Args:
+            indices: Original index of each backend.
+            backends: Backends, in the same order as indices.
+        """
         instance = object.__new__(cls)
-        instance._backend_states = [BackendState(backend=b, index=idx) for idx, b in indexed_backends]
-        instance._init_common(len(indexed_backends))
+        instance._backend_states = tuple(BackendState(backend=b, index=idx) for idx, b in zip(indices, backends))
+        instance._init_common(len(backends))
         return instance
 
     def _init_common(self, num_backends: int) -> None:
         """Common initialization for both constructors."""
         self._lock = threading.Lock()
+        # Original backend index -> position in _backend_states, which is an immutable tuple
+        self._index_to_pos: dict[int, int] = {state.index: pos for pos, state in enumerate(self._backend_states)}
+        # Log prefixes; index and display address never change for a backend
+        self._backend_ids: dict[int, str] = {
+            state.index: f"[backend {state.index}] ({state.backend.get_display_address()})"
+            for state in self._backend_states
+        }
+        # Derived view of _backend_states, rebuilt only when a backend's health changes
+        self._routable_states: tuple[BackendState, ...] = ()
+        self._refresh_routable_states()
+        # Backend that last answered a sequential read; the next read tries it first
+        self._last_read_state: BackendState | None = None
         self._container_lock: threading.RLock | None = None
-        self._shutdown_event = threading.Event()  # Thread-safe shutdown signaling
-        self._executor = ThreadPoolExecutor(
-            max_workers=min(num_backends, MAX_PARALLEL_WORKERS),
-            thread_name_prefix="multi_backend",
+        # Hot paths read the plain flag (a single attribute load); the Event exists for the health thread to wait on
+        self._shutdown = False
+        self._shutdown_event = threading.Event()
+        # Set when a backend leaves routing; the health thread blocks on it while every backend is routable
+        self._degraded_event = threading.Event()
+        # A single backend never fans out, so it gets no pool and every call runs inline
+        self._executor: ThreadPoolExecutor | None = None
+        if num_backends > 1:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(num_backends, MAX_PARALLEL_WORKERS),
+                thread_name_prefix="multi_backend",
+            )
+        # Health pings get their own pool so a hung ping can neither starve operations nor hold up close()
+        self._ping_executor: ThreadPoolExecutor | None = None
+        if num_backends > 1:
+            self._ping_executor = ThreadPoolExecutor(
+                max_workers=min(num_backends, MAX_PARALLEL_WORKERS),
+                thread_name_prefix="multi_backend_health_ping",
+            )
+        # One long-lived checker thread; it only wakes up while some backend is degraded
+        self._health_thread = threading.Thread(
+            target=self._health_loop,
+            name="multi_backend_health",
+            daemon=True,
         )
-        self._health_check_timer: threading.Timer | None = None
-        self._start_health_check_timer()
+        self._health_thread.start()
 
     def _check_not_closed(self) -> None:
         """Raise if backend has been closed.
 
         Must be called at the start of all public operation methods.
         """
-        if self._shutdown_event.is_set():
+        if self._shutdown:
             raise NeptuneMultiBackendClosedError("MultiBackend has been closed")
 
     def iterate_backends(self) -> Iterator[NeptuneBackend]:
@@ -240,17 +382,71 @@ class MultiBackend(NeptuneBackend):
         """Check if this MultiBackend wraps only a single backend."""
         return len(self._backend_states) == 1
 
-    def _raise_all_failed(self, errors: list[BackendError]) -> NoReturn:
+    def _raise_all_failed(self, failures: list[tuple[int, Exception]]) -> NoReturn:
         """Raise appropriate exception based on backend count.
 
+        Args:
+            failures: (backend index, exception) pairs. Callers collect plain pairs so that
+                BackendError objects are only built when everything has actually failed.
+
         For single-backend scenarios, re-raises the original exception to maintain
         backward compatibility with code that expects specific exception types.
         For multi-backend scenarios, raises AllBackendsFailedError.
         """
-        if self._is_single_backend and len(errors) == 1:
+        if self._is_single_backend and len(failures) == 1:
             # Re-raise the original exception for backward compatibility
-            raise errors[0].cause from None
-        raise AllBackendsFailedError(errors)
+            raise failures[0][1] from None
+        raise AllBackendsFailedError([BackendError(backend_index=index, cause=cause) for index, cause in failures])
+
+    def _ordered_failover(self, op_name: str, fn: Callable[[NeptuneBackend], T]) -> T:
+        """Call fn on routable backends in backend order (primary first); return the first success.
+
+        Used for calls whose result carries backend-specific IDs (projects, containers,
+        checkpoints): the primary's answer must win whenever the primary is up, so these are
+        never raced against secondaries or reordered by _read_order(). A later backend is only
+        tried after the ones before it failed, which also keeps writes like create_checkpoint
+        from running on more than one backend.
+
+        Args:
+            op_name: Operation description for failure log lines (e.g. "get project").
+            fn: Called with each backend in turn.
+        """
+        errors: list[tuple[int, Exception]] = []
+        for state in self._snapshot_routable():
+            try:
+                result = fn(state.backend)
+            except _FAILOVER_EXCEPTIONS as e:
+                self._transition_on_failure(state.index, e)
+                errors.append((state.index, e))
+                logger.warning(f"{self._backend_id(state.index)} failed to {op_name}: {e}")
+                continue
+            self._transition_on_success(state.index)
+            return result
+        self._raise_all_failed(errors)
+
+    def _failover_read(self, op: str, *args, **kwargs):
+        """Call backend method `op` on routable backends in order; return the first success.
+
+        Shared by all read delegators, so the failover loop exists once.
+        """
+        # Built on the first failure only; the common path (first backend answers) allocates nothing
+        errors: list[tuple[int, Exception]] | None = None
+        # Bound once: this loop backs every read delegator
+        on_success = self._transition_on_success
+        on_failure = self._transition_on_failure
+        for state in self._read_order():
+            index = state.index
+            try:
+                result = getattr(state.backend, op)(*args, **kwargs)
+                on_success(index)
+                self._last_read_state = state
+                return result
+            except _FAILOVER_EXCEPTIONS as e:
+                on_failure(index, e)
+                if errors is None:
+                    errors = []
+                errors.append((index, e))
+        self._raise_all_failed(errors or [])
 
     def set_container_lock(self, lock: threading.RLock) -> None:
         """Set the container's lock for coordinated synchronization.
@@ -267,14 +463,22 @@ class MultiBackend(NeptuneBackend):
         """
         self._container_lock = lock
 
-    def _start_health_check_timer(self) -> None:
-        """Start periodic health check for degraded backends."""
-        self._health_check_timer = threading.Timer(
-            HEALTH_CHECK_INTERVAL_SECONDS,
-            self._check_degraded_backends,
-        )
-        self._health_check_timer.daemon = True
-        self._health_check_timer.start()
+    def _health_loop(self) -> None:
+        """Check degraded backends every HEALTH_CHECK_INTERVAL_SECONDS while any exist, until shutdown.
+
+        With every backend routable the thread sleeps on _degraded_event, so an idle process or a
+        healthy setup gets no periodic wakeups or pings. The first check runs one interval after a
+        backend is degraded.
+        """
+        while True:
+            self._degraded_event.wait()
+            if self._shutdown_event.wait(HEALTH_CHECK_INTERVAL_SECONDS):
+                return
+            # Cleared before checking: a backend degraded from here on sets it again
+            self._degraded_event.clear()
+            self._check_degraded_backends()
+            if any(isinstance(state.health, Degraded) for state in self._backend_states):
+                self._degraded_event.set()
 
     def _check_degraded_backends(self) -> None:
         """Periodically check if degraded backends have recovered.
@@ -282,150 +486,238 @@ class MultiBackend(NeptuneBackend):
         Note: Requires NeptuneBackend to implement a health_ping() method for health checks.
         The health_ping() method should be a lightweight API call.
 
-        Thread Safety: We snapshot degraded backend indices while holding the lock,
-        then release the lock before calling health_ping() to avoid blocking other operations.
+        Thread Safety: We snapshot degraded backend indices without taking any lock (each health
+        read is a single attribute load), and never hold a lock while calling health_ping().
         Uses atomic transitions to ensure correct state updates.
         """
-        if self._shutdown_event.is_set():
-            return  # Don't check or reschedule during shutdown
+        if self._shutdown:
+            return  # Don't check during shutdown
 
         # Snapshot degraded backend indices and their backends (for ping)
-        with self._lock:
-            degraded_info = [
-                (state.index, state.backend) for state in self._backend_states if isinstance(state.health, Degraded)
-            ]
+        degraded_info = [
+            (state.index, state.backend) for state in self._backend_states if isinstance(state.health, Degraded)
+        ]
 
-        # Ping outside the lock to avoid blocking other operations
+        if not degraded_info:
+            return
+
+        if self._ping_executor is None:
+            # Single backend: ping inline
+            index, backend = degraded_info[0]
+            self._handle_ping_result(index, backend.health_ping)
+            return
+
+        # Ping in parallel so one hanging backend doesn't delay recovery of the others
         # Each backend is checked independently - one failure doesn't skip others
-        for index, backend in degraded_info:
-            backend_id = f"[backend {index}] ({backend.get_display_address()})"
-            try:
-                # Simple health check - requires NeptuneBackend.health_ping() method
-                backend.health_ping()
-                # Atomic transition: Degraded -> Healthy
-                self._transition_on_success(index)
-                logger.info(f"{backend_id} recovered")
-            except Exception as e:
-                # Note: We don't increment failure counter on ping failure
-                # to avoid double-counting (ping is separate from operations)
-                logger.info(
-                    f"{backend_id} health check: still degraded ({e}). Will retry in {HEALTH_CHECK_INTERVAL_SECONDS}s"
-                )
+        try:
+            futures = {self._ping_executor.submit(backend.health_ping): index for index, backend in degraded_info}
+        except RuntimeError:
+            return  # Executor shut down concurrently with close()
+
+        # Handle pings that finished during the submit loop directly; as_completed would lock and
+        # install a waiter on every future, including those
+        pending = []
+        for future in futures:
+            if future.done():
+                self._handle_ping_result(futures[future], future.result)
+            else:
+                pending.append(future)
 
-        # Reschedule only if not shutting down
-        if not self._shutdown_event.is_set():
-            self._start_health_check_timer()
+        try:
+            for future in as_completed(pending, timeout=HEALTH_CHECK_INTERVAL_SECONDS):
+                self._handle_ping_result(futures[future], future.result)
+        except FuturesTimeoutError:
+            logger.info(f"Health check timed out after {HEALTH_CHECK_INTERVAL_SECONDS}s; will retry")
 
-    def _transition_on_success(self, index: int) -> None:
+    def _handle_ping_result(self, index: int, get_result: Callable[[], object]) -> None:
+        """Transition a degraded backend on a successful ping, or log that it is still down."""
+        backend_id = self._backend_id(index)
+        try:
+            # Simple health check - requires NeptuneBackend.health_ping() method
+            get_result()
+            # Atomic transition: Degraded -> Healthy
+            self._transition_on_success(index)
+            logger.info(f"{backend_id} recovered")
+        except Exception as e:
+            # Note: We don't increment failure counter on ping failure
+            # to avoid double-counting (ping is separate from operations)
+            logger.info(
+                f"{backend_id} health check: still degraded ({e}). Will retry in {HEALTH_CHECK_INTERVAL_SECONDS}s"
+            )
+
+    def _transition_on_success(self, index: int, refresh: bool = True) -> bool:
         """Atomically transition backend to Healthy state.
 
         Args:
             index: The original backend index (not position in list).
+            refresh: Rebuild the routable view now; batch callers pass False and refresh once.
+
+        Returns:
+            Whether the backend's routability changed.
 
-        Thread Safety: Reads current state and computes new state while holding lock.
+        Thread Safety: Reads current state and computes new state while holding the state's lock.
         """
-        with self._lock:
-            pos = self._find_state_position(index)
-            if pos is None:
-                return  # Backend not found
-            current = self._backend_states[pos]
-            old_health = current.health
+        state = self._find_state_by_index(index)
+        if state is None:
+            return False  # Backend not found
+        if isinstance(state.health, Healthy):
+            return False  # Steady state: nothing to transition, skip the lock and the allocation
+        with state.lock:
+            old_health = state.health
             new_health = compute_success_health()
-            self._backend_states[pos] = BackendState(
-                backend=current.backend,
-                index=current.index,
-                health=new_health,
-            )
-
-            # Log recovery transitions
-            if isinstance(old_health, Failing):
-                logger.info(f"{self._backend_id(index)} health: Failing -> Healthy (recovered)")
-            elif isinstance(old_health, Degraded):
-                logger.info(f"{self._backend_id(index)} health: Degraded -> Healthy (recovered)")
-
-    def _transition_on_failure(self, index: int, error: Exception) -> None:
+            state.health = new_health
+        routability_changed = self._on_health_changed(old_health, new_health, refresh)
+        if state is self._backend_states[0] and not isinstance(old_health, Healthy):
+            # The primary is back; stop pinning sequential reads to whichever backend covered for it
+            self._last_read_state = None
+
+        # Log recovery transitions
+        if not logger.isEnabledFor(logging.INFO):
+            return routability_changed
+        if isinstance(old_health, Failing):
+            logger.info(f"{self._backend_id(index)} health: Failing -> Healthy (recovered)")
+        elif isinstance(old_health, Degraded):
+            logger.info(f"{self._backend_id(index)} health: Degraded -> Healthy (recovered)")
+        return routability_changed
+
+    def _transition_on_failure(self, index: int, error: Exception, refresh: bool = True) -> bool:
         """Atomically transition backend state on failure.
 
         Args:
             index: The original backend index (not position in list).
+            refresh: Rebuild the routable view now; batch callers pass False and refresh once.
+
+        Returns:
+            Whether the backend's routability changed.
 
-        Thread Safety: Reads current state and computes new state while holding lock.
+        Thread Safety: Reads current state and computes new state while holding the state's lock.
         This ensures consecutive_failures counter is correctly incremented even with
         concurrent failures from multiple threads.
         """
-        with self._lock:
-            pos = self._find_state_position(index)
-            if pos is None:
-                return  # Backend not found
-            current = self._backend_states[pos]
-            old_health = current.health
+        state = self._find_state_by_index(index)
+        if state is None:
+            return False  # Backend not found
+        with state.lock:
+            old_health = state.health
             new_health = compute_failure_health(old_health, error)
-            self._backend_states[pos] = BackendState(
-                backend=current.backend,
-                index=current.index,
-                health=new_health,
+            state.health = new_health
+        routability_changed = self._on_health_changed(old_health, new_health, refresh)
+
+        # Log health state transitions; skip building the messages when warnings are filtered out
+        if not logger.isEnabledFor(logging.WARNING):
+            return routability_changed
+        if isinstance(old_health, Healthy) and isinstance(new_health, Failing):
+            logger.warning(f"{self._backend_id(index)} health: Healthy -> Failing (first failure: {error})")
+        elif isinstance(old_health, Failing) and isinstance(new_health, Failing):
+            logger.warning(
+                f"{self._backend_id(index)} health: Failing -> Failing "
+                f"({new_health.consecutive_failures} consecutive failures)"
+            )
+        elif isinstance(old_health, Failing) and isinstance(new_health, Degraded):
+            logger.warning(
+                f"{self._backend_id(index)} health: Failing -> Degraded "
+                f"({new_health.consecutive_failures} consecutive failures). "
+                f"Will retry in {HEALTH_CHECK_INTERVAL_SECONDS}s"
             )
+        elif isinstance(old_health, Degraded) and isinstance(new_health, Degraded):
+            logger.warning(
+                f"{self._backend_id(index)} health: Degraded -> Degraded "
+                f"({new_health.consecutive_failures} consecutive failures). "
+                f"Will retry in {HEALTH_CHECK_INTERVAL_SECONDS}s"
+            )
+        return routability_changed
 
-            # Log health state transitions
-            if isinstance(old_health, Healthy) and isinstance(new_health, Failing):
-                logger.warning(f"{self._backend_id(index)} health: Healthy -> Failing (first failure: {error})")
-            elif isinstance(old_health, Failing) and isinstance(new_health, Failing):
-                logger.warning(
-                    f"{self._backend_id(index)} health: Failing -> Failing "
-                    f"({new_health.consecutive_failures} consecutive failures)"
-                )
-            elif isinstance(old_health, Failing) and isinstance(new_health, Degraded):
-                logger.warning(
-                    f"{self._backend_id(index)} health: Failing -> Degraded "
-                    f"({new_health.consecutive_failures} consecutive failures). "
-                    f"Will retry in {HEALTH_CHECK_INTERVAL_SECONDS}s"
-                )
-            elif isinstance(old_health, Degraded) and isinstance(new_health, Degraded):
-                logger.warning(
-                    f"{self._backend_id(index)} health: Degraded -> Degraded "
-                    f"({new_health.consecutive_failures} consecutive failures). "
-                    f"Will retry in {HEALTH_CHECK_INTERVAL_SECONDS}s"
-                )
+    def _apply_outcomes(self, outcomes: list[tuple[int, Exception | None]]) -> None:
+        """Apply a batch of (index, error or None) operation outcomes.
+
+        The routable view is rebuilt at most once for the whole batch.
+        """
+        routability_changed = False
+        for index, error in outcomes:
+            if error is None:
+                routability_changed |= self._transition_on_success(index, refresh=False)
+            else:
+                routability_changed |= self._transition_on_failure(index, error, refresh=False)
+        if routability_changed:
+            with self._lock:
+                self._refresh_routable_states()
 
-    def _get_routable_backends(self) -> list[BackendState]:
-        """Get backends that should receive operations.
+    def _on_health_changed(self, old_health: BackendHealth, new_health: BackendHealth, refresh: bool = True) -> bool:
+        """Rebuild the routable view if a transition changed a backend's routability.
+
+        Called after the state's lock is released. Every writer refreshes after its own write,
+        so the last refresh always sees the latest health of every backend.
+
+        Returns:
+            Whether the backend's routability changed.
+        """
+        if old_health._routable is new_health._routable:
+            return False
+        if not new_health._routable:
+            self._degraded_event.set()  # Wake the health thread to start re-checking this backend
+        if refresh:
+            with self._lock:
+                self._refresh_routable_states()
+        return True
+
+    def _refresh_routable_states(self) -> None:
+        """Recompute the cached routable view. Call after any change in a backend's routability.
+
+        Must be called while holding the lock (or before the instance is shared).
+        """
+        states = self._backend_states
+        routable = tuple(s for s in states if is_routable(s.health))
+        # All routable (the steady state) or none routable: share the states tuple itself
+        self._routable_states = routable if 0 < len(routable) < len(states) else states
+
+    def _snapshot_routable(self) -> tuple[BackendState, ...]:
+        """Snapshot the backends that should receive operations.
 
         Returns Healthy and Failing backends, falling back to all if none routable.
+        The view is an immutable tuple, cached and only rebuilt on health changes, so taking a
+        snapshot is a single attribute load: no lock, no filtering pass, no copy.
+
+        Also serves as the closed check for callers that route through it, so they need not
+        call _check_not_closed() first.
+
+        Raises:
+            NeptuneMultiBackendClosedError: If the backend has been closed.
         """
-        with self._lock:
-            routable = [s for s in self._backend_states if is_routable(s.health)]
-            return routable if routable else list(self._backend_states)
+        if self._shutdown:
+            raise NeptuneMultiBackendClosedError("MultiBackend has been closed")
+        return self._routable_states
+
+    def _read_order(self) -> tuple[BackendState, ...]:
+        """Routable snapshot rotated so the backend that last answered a read comes first.
+
+        Keeps sequential reads from paying a failed round-trip to a flapping backend ahead of
+        one that is known to work. Falls back to the plain snapshot if that backend is no
+        longer routable.
+        """
+        states = self._snapshot_routable()
+        preferred = self._last_read_state
+        if preferred is None or states[0] is preferred:
+            return states
+        try:
+            pos = states.index(preferred)
+        except ValueError:
+            return states
+        return states[pos:] + states[:pos]
 
     def _find_state_by_index(self, index: int) -> BackendState | None:
         """Find backend state by its original index."""
-        for state in self._backend_states:
-            if state.index == index:
-                return state
-        return None
-
-    def _find_state_position(self, index: int) -> int | None:
-        """Find the position in _backend_states for a given original index."""
-        for pos, state in enumerate(self._backend_states):
-            if state.index == index:
-                return pos
-        return None
+        pos = self._index_to_pos.get(index)
+        return self._backend_states[pos] if pos is not None else None
 
     def _backend_id(self, index: int) -> str:
         """Format backend identifier including index and URL for logging."""
-        state = self._find_state_by_index(index)
-        if state:
-            return f"[backend {index}] ({state.backend.get_display_address()})"
-        return f"[backend {index}]"
+        backend_id = self._backend_ids.get(index)
+        return backend_id if backend_id is not None else f"[backend {index}]"
 
     def _format_health_status(self, health: BackendHealth) -> str:
         """Format health state for logging."""
-        if isinstance(health, Healthy):
-            return "healthy"
-        elif isinstance(health, Failing):
-            return f"failing, {health.consecutive_failures} errors"
-        elif isinstance(health, Degraded):
-            return f"degraded, {health.consecutive_failures} errors"
-        return "unknown"
+        formatter = _HEALTH_STATUS_FORMATTERS.get(type(health))
+        return formatter(health) if formatter is not None else "unknown"
 
     def mark_backend_disconnected(self, index: int, error: Exception | None = None) -> None:
         """Mark a backend as disconnected (e.g., from async processor connection failures).
@@ -440,21 +732,22 @@ class MultiBackend(NeptuneBackend):
         This is a silent update - it doesn't log transitions since the connection
         issues would have already been logged by the async processor.
         """
+        state = self._find_state_by_index(index)
+        if state is None:
+            return  # Backend not found (shouldn't happen)
+        # Only update if currently healthy - don't override existing failure state.
+        # Checked without the lock first: repeated reports for an already-failed backend are the common case.
+        if not isinstance(state.health, Healthy):
+            return
         if error is None:
             error = Exception("Connection lost")
-        with self._lock:
-            pos = self._find_state_position(index)
-            if pos is None:
-                return  # Backend not found (shouldn't happen)
-            current = self._backend_states[pos]
-            # Only update if currently healthy - don't override existing failure state
-            if isinstance(current.health, Healthy):
-                new_health = Degraded(consecutive_failures=FAILURE_THRESHOLD, last_error=error)
-                self._backend_states[pos] = BackendState(
-                    backend=current.backend,
-                    index=current.index,
-                    health=new_health,
-                )
+        with state.lock:
+            old_health = state.health
+            if not isinstance(old_health, Healthy):
+                return  # Lost a race with another transition
+            new_health = Degraded(consecutive_failures=FAILURE_THRESHOLD, last_error=error)
+            state.health = new_health
+        self._on_health_changed(old_health, new_health)
 
     # =========================================================================
     # NeptuneBackend Interface Implementation
@@ -473,56 +766,19 @@ class MultiBackend(NeptuneBackend):
         return self._backend_states[0].backend._client_config
 
     def get_project(self, project_id):
-        """Get project from the first healthy backend."""
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-
-        for state in backends_to_try:
-            try:
-                result = state.backend.get_project(project_id)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-                logger.warning(f"{self._backend_id(state.index)} failed to get project: {e}")
-
-        self._raise_all_failed(errors)
+        """Get project from the first healthy backend, primary first."""
+        return self._ordered_failover("get project", lambda backend: backend.get_project(project_id))
 
     def get_available_projects(self, workspace_id=None, search_term=None):
-        """Get available projects from the first healthy backend."""
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-
-        for state in backends_to_try:
-            try:
-                result = state.backend.get_available_projects(workspace_id, search_term)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-
-        self._raise_all_failed(errors)
+        """Get available projects from the first healthy backend, primary first."""
+        return self._ordered_failover(
+            "get available projects",
+            lambda backend: backend.get_available_projects(workspace_id, search_term),
+        )
 
     def get_available_workspaces(self):
-        """Get available workspaces from the first healthy backend."""
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-
-        for state in backends_to_try:
-            try:
-                result = state.backend.get_available_workspaces()
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-
-        self._raise_all_failed(errors)
+        """Get available workspaces from the first healthy backend, primary first."""
+        return self._ordered_failover("get available workspaces", lambda backend: backend.get_available_workspaces())
 
     def create_run(
         self,
@@ -561,17 +817,16 @@ class MultiBackend(NeptuneBackend):
         """
         self._check_not_closed()
 
-        errors: list[Exception] = []
+        errors: list[tuple[int, Exception]] = []
 
-        # Snapshot backends under lock
-        with self._lock:
-            backends_snapshot = list(self._backend_states)
+        # The states tuple is never mutated, so it is its own snapshot
+        backends_snapshot = self._backend_states
 
         if not backends_snapshot:
             raise AllBackendsFailedError([])
 
         # Check shutdown before proceeding
-        if self._shutdown_event.is_set():
+        if self._shutdown:
             raise NeptuneMultiBackendClosedError("MultiBackend has been closed")
 
         # Step 1: Call primary backend (index 0) first to get authoritative IDs
@@ -579,8 +834,9 @@ class MultiBackend(NeptuneBackend):
         primary_result: ApiExperiment | None = None
         total_backends = len(backends_snapshot)
         is_multi_backend = total_backends > 1
+        info_enabled = logger.isEnabledFor(logging.INFO)
 
-        if is_multi_backend:
+        if is_multi_backend and info_enabled:
             logger.info(f"Initializing run on {total_backends} backends...")
             logger.info(f"{self._backend_id(primary_state.index)}: initializing (primary)...")
 
@@ -595,7 +851,7 @@ class MultiBackend(NeptuneBackend):
                 _external_sys_id=_external_sys_id,
             )
             self._transition_on_success(primary_state.index)
-            if is_multi_backend:
+            if is_multi_backend and info_enabled:
                 logger.info(f"{self._backend_id(primary_state.index)}: initialized (primary)")
         except Exception as e:
             self._transition_on_failure(primary_state.index, e)
@@ -604,7 +860,7 @@ class MultiBackend(NeptuneBackend):
                 logger.warning(f"{self._backend_id(primary_state.index)}: failed (primary) - {error_type}: {e}")
             else:
                 logger.warning(f"{self._backend_id(primary_state.index)} failed to create run: {error_type}: {e}")
-            errors.append(BackendError(backend_index=primary_state.index, cause=e))
+            errors.append((primary_state.index, e))
             self._raise_all_failed(errors)
 
         # Step 2: Fan out to remaining backends with primary's IDs
@@ -613,7 +869,8 @@ class MultiBackend(NeptuneBackend):
             return primary_result
 
         def create_on_secondary(state: BackendState):
-            logger.info(f"{self._backend_id(state.index)}: initializing (secondary)...")
+            if info_enabled:
+                logger.info(f"{self._backend_id(state.index)}: initializing (secondary)...")
             try:
                 result = state.backend.create_run(
                     project_id,
@@ -625,7 +882,8 @@ class MultiBackend(NeptuneBackend):
                     _external_sys_id=primary_result.sys_id,
                 )
                 self._transition_on_success(state.index)
-                logger.info(f"{self._backend_id(state.index)}: initialized (secondary)")
+                if info_enabled:
+                    logger.info(f"{self._backend_id(state.index)}: initialized (secondary)")
                 return (state.index, result, None)
             except Exception as e:
                 self._transition_on_failure(state.index, e)
@@ -634,24 +892,27 @@ class MultiBackend(NeptuneBackend):
 
         # Execute remaining backends in parallel
         try:
-            futures = {self._executor.submit(create_on_secondary, state): state for state in remaining_backends}
+            futures = [self._executor.submit(create_on_secondary, state) for state in remaining_backends]
         except RuntimeError:
             raise NeptuneMultiBackendClosedError("MultiBackend has been closed")
 
-        try:
-            for future in as_completed(futures, timeout=MAX_RETRY_TIMEOUT_SECONDS):
-                idx, result, error = future.result()
-                if error:
-                    logger.warning(f"{self._backend_id(idx)}: failed (secondary) - {error}")
-                    errors.append(BackendError(backend_index=idx, cause=error))
-        except FuturesTimeoutError:
+        # One wait for the whole fan-out; whatever is still running at the deadline counts as timed out
+        done, not_done = wait(futures, timeout=MAX_RETRY_TIMEOUT_SECONDS, return_when=ALL_COMPLETED)
+        for future in futures:
+            if future not in done:
+                continue
+            idx, result, error = future.result()
+            if error:
+                logger.warning(f"{self._backend_id(idx)}: failed (secondary) - {error}")
+                errors.append((idx, error))
+        if not_done:
             logger.warning(f"create_run() timed out after {MAX_RETRY_TIMEOUT_SECONDS}s")
 
         # Log initialization summary (only for multi-backend)
         successful_count = 1 + len(remaining_backends) - len(errors)  # 1 for primary
         if errors:
             logger.warning(f"Run initialization completed: {successful_count}/{total_backends} backends ready")
-        else:
+        elif info_enabled:
             logger.info(f"Run initialization completed: {successful_count}/{total_backends} backends ready")
 
         # Return primary backend's result (authoritative)
@@ -661,37 +922,40 @@ class MultiBackend(NeptuneBackend):
         """Create model on all backends in parallel."""
         self._check_not_closed()
         results: dict[int, ApiExperiment] = {}
-        errors: list[Exception] = []
+        errors: list[tuple[int, Exception]] = []
 
-        with self._lock:
-            backends_snapshot = list(self._backend_states)
+        backends_snapshot = self._backend_states
 
         def create_on_backend(state: BackendState):
             try:
-                result = state.backend.create_model(project_id, key)
-                self._transition_on_success(state.index)
-                return (state.index, result, None)
+                return (state.index, state.backend.create_model(project_id, key), None)
             except Exception as e:
-                self._transition_on_failure(state.index, e)
                 return (state.index, None, e)
 
-        if self._shutdown_event.is_set():
+        if self._shutdown:
             raise NeptuneMultiBackendClosedError("MultiBackend has been closed")
 
-        try:
-            futures = {self._executor.submit(create_on_backend, state): state for state in backends_snapshot}
-        except RuntimeError:
-            raise NeptuneMultiBackendClosedError("MultiBackend has been closed")
+        if len(backends_snapshot) == 1:
+            # Single backend: call inline, no thread hop
+            completed = [create_on_backend(backends_snapshot[0])]
+        else:
+            try:
+                futures = [self._executor.submit(create_on_backend, state) for state in backends_snapshot]
+            except RuntimeError:
+                raise NeptuneMultiBackendClosedError("MultiBackend has been closed")
 
-        try:
-            for future in as_completed(futures, timeout=MAX_RETRY_TIMEOUT_SECONDS):
-                idx, result, error = future.result()
-                if error:
-                    errors.append(BackendError(backend_index=idx, cause=error))
-                else:
-                    results[idx] = result
-        except FuturesTimeoutError:
-            pass
+            # One wait for the whole fan-out; backends still running at the deadline are skipped
+            done, _ = wait(futures, timeout=MAX_RETRY_TIMEOUT_SECONDS, return_when=ALL_COMPLETED)
+            completed = [future.result() for future in futures if future in done]
+
+        # Health transitions for the whole fan-out in one batch
+        self._apply_outcomes([(idx, error) for idx, _, error in completed])
+
+        for idx, result, error in completed:
+            if error:
+                errors.append((idx, error))
+            else:
+                results[idx] = result
 
         if not results:
             self._raise_all_failed(errors)
@@ -703,37 +967,40 @@ class MultiBackend(NeptuneBackend):
         """Create model version on all backends in parallel."""
         self._check_not_closed()
         results: dict[int, ApiExperiment] = {}
-        errors: list[Exception] = []
+        errors: list[tuple[int, Exception]] = []
 
-        with self._lock:
-            backends_snapshot = list(self._backend_states)
+        backends_snapshot = self._backend_states
 
         def create_on_backend(state: BackendState):
             try:
-                result = state.backend.create_model_version(project_id, model_id)
-                self._transition_on_success(state.index)
-                return (state.index, result, None)
+                return (state.index, state.backend.create_model_version(project_id, model_id), None)
             except Exception as e:
-                self._transition_on_failure(state.index, e)
                 return (state.index, None, e)
 
-        if self._shutdown_event.is_set():
+        if self._shutdown:
             raise NeptuneMultiBackendClosedError("MultiBackend has been closed")
 
-        try:
-            futures = {self._executor.submit(create_on_backend, state): state for state in backends_snapshot}
-        except RuntimeError:
-            raise NeptuneMultiBackendClosedError("MultiBackend has been closed")
+        if len(backends_snapshot) == 1:
+            # Single backend: call inline, no thread hop
+            completed = [create_on_backend(backends_snapshot[0])]
+        else:
+            try:
+                futures = [self._executor.submit(create_on_backend, state) for state in backends_snapshot]
+            except RuntimeError:
+                raise NeptuneMultiBackendClosedError("MultiBackend has been closed")
 
-        try:
-            for future in as_completed(futures, timeout=MAX_RETRY_TIMEOUT_SECONDS):
-                idx, result, error = future.result()
-                if error:
-                    errors.append(BackendError(backend_index=idx, cause=error))
-                else:
-                    results[idx] = result
-        except FuturesTimeoutError:
-            pass
+            # One wait for the whole fan-out; backends still running at the deadline are skipped
+            done, _ = wait(futures, timeout=MAX_RETRY_TIMEOUT_SECONDS, return_when=ALL_COMPLETED)
+            completed = [future.result() for future in futures if future in done]
+
+        # Health transitions for the whole fan-out in one batch
+        self._apply_outcomes([(idx, error) for idx, _, error in completed])
+
+        for idx, result, error in completed:
+            if error:
+                errors.append((idx, error))
+            else:
+                results[idx] = result
 
         if not results:
             self._raise_all_failed(errors)
@@ -742,38 +1009,18 @@ class MultiBackend(NeptuneBackend):
         return results[lowest_index]
 
     def get_metadata_container(self, container_id, expected_container_type):
-        """Get metadata container from first healthy backend."""
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-
-        for state in backends_to_try:
-            try:
-                result = state.backend.get_metadata_container(container_id, expected_container_type)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-
-        self._raise_all_failed(errors)
+        """Get metadata container from the first healthy backend, primary first."""
+        return self._ordered_failover(
+            "get metadata container",
+            lambda backend: backend.get_metadata_container(container_id, expected_container_type),
+        )
 
     def create_checkpoint(self, notebook_id, jupyter_path):
-        """Create checkpoint on first healthy backend."""
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-
-        for state in backends_to_try:
-            try:
-                result = state.backend.create_checkpoint(notebook_id, jupyter_path)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-
-        self._raise_all_failed(errors)
+        """Create checkpoint on the first healthy backend, primary first."""
+        return self._ordered_failover(
+            "create checkpoint",
+            lambda backend: backend.create_checkpoint(notebook_id, jupyter_path),
+        )
 
     def execute_operations(
         self,
@@ -799,66 +1046,90 @@ class MultiBackend(NeptuneBackend):
             - If ALL backends fail: raises AllBackendsFailedError with all errors
             - If SOME backends fail: returns success with BackendError list from failed backends
         """
-        self._check_not_closed()
-
-        backend_errors: list[NeptuneException] = []
         results: list[tuple[int, list[NeptuneException]]] = []
 
-        backends_to_use = self._get_routable_backends()
-
-        logger.debug(f"Flushing {len(operations)} operations to {len(backends_to_use)} backend(s)")
+        backends_to_use = self._snapshot_routable()
 
-        def execute_on_backend(state: BackendState):
-            try:
-                result = state.backend.execute_operations(container_id, container_type, operations, operation_storage)
-                # Atomic transition to Healthy
-                self._transition_on_success(state.index)
-                return (state.index, result, None)
-            except Exception as e:
-                # Atomic transition based on failure (may become Degraded)
-                self._transition_on_failure(state.index, e)
-                return (state.index, None, e)
+        # DEBUG is off in normal runs; don't format (or repr partial errors) for lines nobody sees
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(f"Flushing {len(operations)} operations to {len(backends_to_use)} backend(s)")
 
         # Check shutdown before submitting to avoid RuntimeError
-        if self._shutdown_event.is_set():
+        if self._shutdown:
             raise NeptuneMultiBackendClosedError("MultiBackend has been closed")
 
-        # Execute in parallel
+        if len(backends_to_use) == 1:
+            # Single backend: call inline and return directly, no fan-out bookkeeping
+            state = backends_to_use[0]
+            try:
+                processed, partial_errors = state.backend.execute_operations(
+                    container_id, container_type, operations, operation_storage
+                )
+            except Exception as e:
+                self._transition_on_failure(state.index, e)
+                logger.warning(f"{self._backend_id(state.index)} failed: {e}")
+                self._raise_all_failed([(state.index, e)])
+            self._transition_on_success(state.index)
+            if debug_enabled:
+                for err in partial_errors:
+                    logger.debug(f"Partial error from successful backend: {err}")
+                logger.debug(f"Buffer flush complete: {processed} operations processed")
+            return processed, []
+
+        # Execute in parallel; the caller thread takes the last backend itself instead of idling
         try:
-            futures = {self._executor.submit(execute_on_backend, state): state for state in backends_to_use}
+            futures = [
+                self._executor.submit(
+                    _execute_on_backend, state, container_id, container_type, operations, operation_storage
+                )
+                for state in backends_to_use[:-1]
+            ]
         except RuntimeError:
             # Executor was shut down between our check and submit
             raise NeptuneMultiBackendClosedError("MultiBackend has been closed")
-
-        for future in as_completed(futures):
-            idx, result, error = future.result()
+        last_outcome = _execute_on_backend(
+            backends_to_use[-1], container_id, container_type, operations, operation_storage
+        )
+        # All results are needed anyway, so collect in backend order rather than completion order
+        completed = [future.result() for future in futures]
+        completed.append(last_outcome)
+
+        outcomes: list[tuple[int, Exception | None]] = []
+        failures: list[tuple[int, Exception]] = []
+        for idx, result, error in completed:
+            outcomes.append((idx, error))
             if error:
                 logger.warning(f"{self._backend_id(idx)} failed: {error}")
-                backend_errors.append(BackendError(backend_index=idx, cause=error))
+                failures.append((idx, error))
             else:
                 results.append(result)
 
+        # Atomic transitions for every backend (failures may become Degraded)
+        self._apply_outcomes(outcomes)
+
         if not results:
-            self._raise_all_failed(backend_errors)
+            self._raise_all_failed(failures)
 
         # Return maximum processed count (optimistic - at least one backend processed this many)
         max_processed = max(r[0] for r in results)
 
         # Log partial errors from successful backends at DEBUG (not returned to caller)
-        for processed, partial_errors in results:
-            for err in partial_errors:
-                logger.debug(f"Partial error from successful backend: {err}")
-
-        logger.debug(f"Buffer flush complete: {max_processed} operations processed")
+        if debug_enabled:
+            for processed, partial_errors in results:
+                for err in partial_errors:
+                    logger.debug(f"Partial error from successful backend: {err}")
+            logger.debug(f"Buffer flush complete: {max_processed} operations processed")
 
         # Return only errors from completely failed backends
+        backend_errors: list[NeptuneException] = [
+            BackendError(backend_index=idx, cause=error) for idx, error in failures
+        ]
         return max_processed, backend_errors
 
     def get_attributes(self, container_id: str, container_type: ContainerType) -> list[Attribute]:
         """Read operations: try healthy backends first, use first successful response."""
-        self._check_not_closed()
-
-        backends_to_try = self._get_routable_backends()
+        backends_to_try = self._read_order()
         errors = []
 
         for state in backends_to_try:
@@ -866,270 +1137,42 @@ class MultiBackend(NeptuneBackend):
                 result = state.backend.get_attributes(container_id, container_type)
                 # Atomic transition to Healthy
                 self._transition_on_success(state.index)
+                self._last_read_state = state
                 return result
-            except Exception as e:
+            except _FAILOVER_EXCEPTIONS as e:
                 # Atomic transition based on failure (may become Degraded)
                 self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
+                errors.append((state.index, e))
                 logger.warning(f"{self._backend_id(state.index)} failed to get attributes: {e}")
 
         self._raise_all_failed(errors)
 
-    # Delegate read operations to first healthy backend
-    def download_file(self, container_id, container_type, path, destination=None, progress_bar=None):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.download_file(
-                    container_id=container_id,
-                    container_type=container_type,
-                    path=path,
-                    destination=destination,
-                    progress_bar=progress_bar,
-                )
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def download_file_set(self, container_id, container_type, path, destination=None, progress_bar=None):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.download_file_set(
-                    container_id=container_id,
-                    container_type=container_type,
-                    path=path,
-                    destination=destination,
-                    progress_bar=progress_bar,
-                )
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def get_float_attribute(self, container_id, container_type, path):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.get_float_attribute(container_id, container_type, path)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def get_int_attribute(self, container_id, container_type, path):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.get_int_attribute(container_id, container_type, path)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def get_bool_attribute(self, container_id, container_type, path):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.get_bool_attribute(container_id, container_type, path)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def get_file_attribute(self, container_id, container_type, path):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.get_file_attribute(container_id, container_type, path)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def get_string_attribute(self, container_id, container_type, path):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.get_string_attribute(container_id, container_type, path)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def get_datetime_attribute(self, container_id, container_type, path):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.get_datetime_attribute(container_id, container_type, path)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def get_artifact_attribute(self, container_id, container_type, path):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.get_artifact_attribute(container_id, container_type, path)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def list_artifact_files(self, project_id, artifact_hash):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.list_artifact_files(project_id, artifact_hash)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def get_float_series_attribute(self, container_id, container_type, path):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.get_float_series_attribute(container_id, container_type, path)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def get_string_series_attribute(self, container_id, container_type, path):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.get_string_series_attribute(container_id, container_type, path)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def get_string_set_attribute(self, container_id, container_type, path):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.get_string_set_attribute(container_id, container_type, path)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def download_file_series_by_index(self, container_id, container_type, path, index, destination, progress_bar):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.download_file_series_by_index(
-                    container_id, container_type, path, index, destination, progress_bar
-                )
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def get_image_series_values(self, container_id, container_type, path, offset, limit):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.get_image_series_values(container_id, container_type, path, offset, limit)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def get_string_series_values(self, container_id, container_type, path, offset, limit):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.get_string_series_values(container_id, container_type, path, offset, limit)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def get_float_series_values(self, container_id, container_type, path, offset, limit):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.get_float_series_values(container_id, container_type, path, offset, limit)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def get_run_url(self, run_id, workspace, project_name, sys_id):
-        return self._backend_states[0].backend.get_run_url(run_id, workspace, project_name, sys_id)
+    # Delegate read operations to first healthy backend (see _failover_read)
+    download_file = _failover_read_method("download_file")
+    download_file_set = _failover_read_method("download_file_set")
+    get_float_attribute = _failover_read_method("get_float_attribute")
+    get_int_attribute = _failover_read_method("get_int_attribute")
+    get_bool_attribute = _failover_read_method("get_bool_attribute")
+    get_file_attribute = _failover_read_method("get_file_attribute")
+    get_string_attribute = _failover_read_method("get_string_attribute")
+    get_datetime_attribute = _failover_read_method("get_datetime_attribute")
+    get_artifact_attribute = _failover_read_method("get_artifact_attribute")
+    list_artifact_files = _failover_read_method("list_artifact_files")
+    get_float_series_attribute = _failover_read_method("get_float_series_attribute")
+    get_string_series_attribute = _failover_read_method("get_string_series_attribute")
+    get_string_set_attribute = _failover_read_method("get_string_set_attribute")
+    download_file_series_by_index = _failover_read_method("download_file_series_by_index")
+    get_image_series_values = _failover_read_method("get_image_series_values")
+    get_string_series_values = _failover_read_method("get_string_series_values")
+    get_float_series_values = _failover_read_method("get_float_series_values")
+    fetch_atom_attribute_values = _failover_read_method("fetch_atom_attribute_values")
+    list_fileset_files = _failover_read_method("list_fileset_files")
+
+    # URLs are formatted locally from the primary backend's address; no failover needed
+    get_run_url = _primary_method("get_run_url")
+    get_project_url = _primary_method("get_project_url")
+    get_model_url = _primary_method("get_model_url")
+    get_model_version_url = _primary_method("get_model_version_url")
 
     def get_all_run_urls(self, run_id, workspace, project_name, sys_id) -> list[str]:
         """Get run URLs from all backends."""
@@ -1142,31 +1185,6 @@ class MultiBackend(NeptuneBackend):
                 pass  # Skip backends that fail to generate URL
         return urls
 
-    def get_project_url(self, project_id, workspace, project_name):
-        return self._backend_states[0].backend.get_project_url(project_id, workspace, project_name)
-
-    def get_model_url(self, model_id, workspace, project_name, sys_id):
-        return self._backend_states[0].backend.get_model_url(model_id, workspace, project_name, sys_id)
-
-    def get_model_version_url(self, model_version_id, model_id, workspace, project_name, sys_id):
-        return self._backend_states[0].backend.get_model_version_url(
-            model_version_id, model_id, workspace, project_name, sys_id
-        )
-
-    def fetch_atom_attribute_values(self, container_id, container_type, path):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.fetch_atom_attribute_values(container_id, container_type, path)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
     def search_leaderboard_entries(
         self,
         project_id,
@@ -1183,86 +1201,84 @@ class MultiBackend(NeptuneBackend):
         states=None,
         trashed=False,
     ):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.search_leaderboard_entries(
-                    project_id=project_id,
-                    types=types,
-                    columns=columns,
-                    limit=limit,
-                    offset=offset,
-                    sort_by=sort_by,
-                    ascending=ascending,
-                    progress_bar=progress_bar,
-                    tags=tags,
-                    run_ids=run_ids,
-                    owners=owners,
-                    states=states,
-                    trashed=trashed,
-                )
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
-
-    def list_fileset_files(self, attribute, container_id, path):
-        self._check_not_closed()
-        backends_to_try = self._get_routable_backends()
-        errors = []
-        for state in backends_to_try:
-            try:
-                result = state.backend.list_fileset_files(attribute, container_id, path)
-                self._transition_on_success(state.index)
-                return result
-            except Exception as e:
-                self._transition_on_failure(state.index, e)
-                errors.append(BackendError(backend_index=state.index, cause=e))
-        self._raise_all_failed(errors)
+        # Forwarded by keyword: backends' positional parameters differ past progress_bar
+        return self._failover_read(
+            "search_leaderboard_entries",
+            project_id=project_id,
+            types=types,
+            columns=columns,
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by,
+            ascending=ascending,
+            progress_bar=progress_bar,
+            tags=tags,
+            run_ids=run_ids,
+            owners=owners,
+            states=states,
+            trashed=trashed,
+        )
 
     def close(self) -> None:
         """Close all backends and cleanup resources.
 
+        Safe to call more than once; only the first call does anything.
+
         Thread Safety:
-            1. Sets shutdown event to reject new operations
-            2. Cancels health check timer
+            1. Sets shutdown event to reject new operations and stop the health check thread
+            2. Abandons in-flight health pings (their pool is shut down without waiting)
             3. Shuts down executor (waits for in-flight operations to complete)
-            4. Closes all backends sequentially (they're now idle)
+            4. Closes all backends in parallel (they're now idle)
 
         This ordering ensures backends are not closed while operations are in-flight.
         """
-        # Signal shutdown to prevent new operations and timer rescheduling
+        # Signal shutdown to prevent new operations; also wakes the health check thread
+        with self._lock:
+            if self._shutdown:
+                return  # Already closed (or closing)
+            self._shutdown = True
         self._shutdown_event.set()
+        self._degraded_event.set()  # The health thread may be idle, waiting for a degraded backend
 
-        # Stop health check timer
-        if self._health_check_timer:
-            self._health_check_timer.cancel()
+        # Don't wait on health pings: one may be stuck on the network, and the (daemon) health thread
+        # exits on its own once the shutdown event is set
+        if self._ping_executor is not None:
+            try:
+                self._ping_executor.shutdown(wait=False, cancel_futures=True)
+            except TypeError:  # cancel_futures is Python 3.9+
+                self._ping_executor.shutdown(wait=False)
 
         # Shutdown executor and wait for in-flight operations to complete
         # This must happen BEFORE closing backends to avoid closing while in use
-        self._executor.shutdown(wait=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
 
         # Now close all backends (they're idle, no concurrent operations)
-        # Sequential is fine here since backends are idle
-        is_multi_backend = len(self._backend_states) > 1
-        if is_multi_backend:
+        if not self._is_single_backend:
             logger.info("Closing connection to backends...")
+            # Teardown is independent network I/O per backend, so overlap it
+            with ThreadPoolExecutor(
+                max_workers=min(len(self._backend_states), MAX_PARALLEL_WORKERS),
+                thread_name_prefix="multi_backend_close",
+            ) as close_executor:
+                for _ in close_executor.map(self._close_backend, self._backend_states):
+                    pass
+        else:
+            self._close_backend(self._backend_states[0])
 
-        for state in self._backend_states:
+    def _close_backend(self, state: BackendState) -> None:
+        """Close one backend, logging (never raising) on failure."""
+        is_multi_backend = not self._is_single_backend
+        if is_multi_backend:
             health_status = self._format_health_status(state.health)
+            logger.info(f"{self._backend_id(state.index)}: closing ({health_status})...")
+        try:
+            state.backend.close()
             if is_multi_backend:
-                logger.info(f"{self._backend_id(state.index)}: closing ({health_status})...")
-            try:
-                state.backend.close()
-                if is_multi_backend:
-                    logger.info(f"{self._backend_id(state.index)}: closed")
-            except Exception as e:
-                error_type = type(e).__name__
-                if is_multi_backend:
-                    logger.warning(f"{self._backend_id(state.index)}: failed to close - {error_type}: {e}")
-                else:
-                    logger.warning(f"Error closing backend {state.index}: {error_type}: {e}")
+                logger.info(f"{self._backend_id(state.index)}: closed")
+        except Exception as e:
+            error_type = type(e).__name__
+            if is_multi_backend:
+                logger.warning(f"{self._backend_id(state.index)}: failed to close - {error_type}: {e}")
+            else:
+                logger.warning(f"Error closing backend {state.index}: {error_type}: {e}")
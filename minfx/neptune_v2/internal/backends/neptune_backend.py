@@ -18,12 +18,15 @@ from __future__ import annotations
 __all__ = ["NeptuneBackend"]
 
 import abc
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Any,
     Generator,
 )
 
+from minfx.neptune_v2.internal.backends.api_model import AttributeType
+
 if TYPE_CHECKING:
     from minfx.neptune_v2.api.dtos import FileEntry
     from minfx.neptune_v2.common.exceptions import NeptuneException
@@ -33,7 +36,6 @@ if TYPE_CHECKING:
         ApiExperiment,
         ArtifactAttribute,
         Attribute,
-        AttributeType,
         BoolAttribute,
         DatetimeAttribute,
         FileAttribute,
@@ -60,6 +62,21 @@ if TYPE_CHECKING:
     from minfx.neptune_v2.internal.websockets.websockets_factory import WebsocketsFactory
     from minfx.neptune_v2.typing import ProgressBarType
 
+# Attribute type -> NeptuneBackend getter used by the default get_attributes_bulk()
+_ATTRIBUTE_GETTERS: dict[AttributeType, str] = {
+    AttributeType.FLOAT: "get_float_attribute",
+    AttributeType.INT: "get_int_attribute",
+    AttributeType.BOOL: "get_bool_attribute",
+    AttributeType.FILE: "get_file_attribute",
+    AttributeType.STRING: "get_string_attribute",
+    AttributeType.DATETIME: "get_datetime_attribute",
+    AttributeType.ARTIFACT: "get_artifact_attribute",
+    AttributeType.FLOAT_SERIES: "get_float_series_attribute",
+    AttributeType.STRING_SERIES: "get_string_series_attribute",
+    AttributeType.STRING_SET: "get_string_set_attribute",
+}
+_BULK_MAX_WORKERS = 8
+
 
 class NeptuneBackend:
     def close(self) -> None:
@@ -230,6 +247,39 @@ class NeptuneBackend:
     ) -> ArtifactAttribute:
         pass
 
+    def get_attributes_bulk(
+        self,
+        container_id: str,
+        container_type: ContainerType,
+        paths: list[tuple[AttributeType, list[str]]],
+    ) -> list[Any]:
+        """Fetch several typed attributes at once, returned in the order of `paths`.
+
+        The default calls the matching get_*_attribute getters concurrently, so the round-trips
+        overlap; backends with a batch endpoint can override it with a single request.
+
+        Raises:
+            ValueError: If an attribute type has no single-attribute getter.
+        """
+        getters = []
+        for attribute_type, _ in paths:
+            getter_name = _ATTRIBUTE_GETTERS.get(attribute_type)
+            if getter_name is None:
+                raise ValueError(f"Cannot fetch attribute of type {attribute_type} in bulk")
+            getters.append(getattr(self, getter_name))
+
+        if len(paths) <= 1:
+            return [getter(container_id, container_type, path) for getter, (_, path) in zip(getters, paths)]
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(paths), _BULK_MAX_WORKERS), thread_name_prefix="get_attributes_bulk"
+        ) as executor:
+            futures = [
+                executor.submit(getter, container_id, container_type, path)
+                for getter, (_, path) in zip(getters, paths)
+            ]
+            return [future.result() for future in futures]
+
     @abc.abstractmethod
     def list_artifact_files(self, project_id: str, artifact_hash: str) -> list[ArtifactFileData]:
         pass
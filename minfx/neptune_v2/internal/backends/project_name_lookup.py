@@ -17,6 +17,7 @@ from __future__ import annotations
 
 __all__ = ["project_name_lookup"]
 
+from concurrent.futures import ThreadPoolExecutor
 import os
 from typing import TYPE_CHECKING
 
@@ -39,8 +40,11 @@ def project_name_lookup(backend: NeptuneBackend, name: QualifiedName | None = No
     if not name:
         name = os.getenv(PROJECT_ENV_NAME)
     if not name:
-        available_workspaces = backend.get_available_workspaces()
-        available_projects = backend.get_available_projects()
+        # Both lists only feed the error message; fetch them concurrently to pay one round-trip
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="project_name_lookup") as executor:
+            workspaces_future = executor.submit(backend.get_available_workspaces)
+            available_projects = backend.get_available_projects()
+            available_workspaces = workspaces_future.result()
 
         raise NeptuneMissingProjectNameException(
             available_workspaces=available_workspaces,
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 __all__ = ["ApiMethodWrapper", "SwaggerClientWrapper"]
 
+import functools
 from typing import (
     TYPE_CHECKING,
 )
@@ -41,6 +42,62 @@ if TYPE_CHECKING:
 
 from typing import Callable
 
+@functools.lru_cache(maxsize=None)
+def _get_error_processors() -> dict[str, Callable[[dict], Exception]]:
+    """Map API errorType values to exception factories; built on the first HTTP error only."""
+    from minfx.neptune_v2.management.exceptions import (
+        ActiveProjectsLimitReachedException,
+        IncorrectIdentifierException,
+        ObjectNotFound,
+        ProjectKeyCollision,
+        ProjectKeyInvalid,
+        ProjectNameCollision,
+        ProjectNameInvalid,
+        ProjectPrivacyRestrictedException,
+        ProjectsLimitReached,
+    )
+
+    return {
+        "ATTRIBUTES_PER_EXPERIMENT_LIMIT_EXCEEDED": lambda response_body: NeptuneFieldCountLimitExceedException(
+            limit=response_body.get("limit", "<unknown limit>"),
+            container_type=response_body.get("experimentType", "object"),
+            identifier=response_body.get("experimentQualifiedName", "<unknown identifier>"),
+        ),
+        "AUTHORIZATION_TOKEN_EXPIRED": lambda _: NeptuneAuthTokenExpired(),
+        "EXPERIMENT_NOT_FOUND": lambda _: ObjectNotFound(),
+        "INCORRECT_IDENTIFIER": lambda response_body: IncorrectIdentifierException(
+            identifier=response_body.get("identifier", "<Unknown identifier>")
+        ),
+        "LIMIT_OF_PROJECTS_REACHED": lambda _: ProjectsLimitReached(),
+        "PROJECT_KEY_COLLISION": lambda response_body: ProjectKeyCollision(
+            key=response_body.get("key", "<unknown key>")
+        ),
+        "PROJECT_KEY_INVALID": lambda response_body: ProjectKeyInvalid(
+            key=response_body.get("key", "<unknown key>"),
+            reason=response_body.get("reason", "Unknown reason"),
+        ),
+        "PROJECT_NAME_COLLISION": lambda response_body: ProjectNameCollision(
+            key=response_body.get("key", "<unknown key>")
+        ),
+        "PROJECT_NAME_INVALID": lambda response_body: ProjectNameInvalid(
+            name=response_body.get("name", "<unknown name>")
+        ),
+        "VISIBILITY_RESTRICTED": lambda response_body: ProjectPrivacyRestrictedException(
+            requested=response_body.get("requestedValue"),
+            allowed=response_body.get("allowedValues"),
+        ),
+        "WORKSPACE_IN_READ_ONLY_MODE": lambda response_body: NeptuneLimitExceedException(
+            reason=response_body.get("title", "Unknown reason")
+        ),
+        "PROJECT_LIMITS_EXCEEDED": lambda response_body: NeptuneLimitExceedException(
+            reason=response_body.get("title", "Unknown reason")
+        ),
+        "LIMIT_OF_ACTIVE_PROJECTS_REACHED": lambda response_body: ActiveProjectsLimitReachedException(
+            currentQuota=response_body.get("currentQuota", "<unknown quota>")
+        ),
+        "WRITE_ACCESS_DENIED_TO_ARCHIVED_PROJECT": lambda _: WritingToArchivedProjectException(),
+    }
+
 
 class ApiMethodWrapper:
     def __init__(self, api_method: Callable[..., object]) -> None:
@@ -48,62 +105,9 @@ class ApiMethodWrapper:
 
     @staticmethod
     def handle_neptune_http_errors(response: object, exception: HTTPError | None = None) -> None:
-        from minfx.neptune_v2.management.exceptions import (
-            ActiveProjectsLimitReachedException,
-            IncorrectIdentifierException,
-            ObjectNotFound,
-            ProjectKeyCollision,
-            ProjectKeyInvalid,
-            ProjectNameCollision,
-            ProjectNameInvalid,
-            ProjectPrivacyRestrictedException,
-            ProjectsLimitReached,
-        )
-
-        error_processors: dict[str, Callable[[dict], Exception]] = {
-            "ATTRIBUTES_PER_EXPERIMENT_LIMIT_EXCEEDED": lambda response_body: NeptuneFieldCountLimitExceedException(
-                limit=response_body.get("limit", "<unknown limit>"),
-                container_type=response_body.get("experimentType", "object"),
-                identifier=response_body.get("experimentQualifiedName", "<unknown identifier>"),
-            ),
-            "AUTHORIZATION_TOKEN_EXPIRED": lambda _: NeptuneAuthTokenExpired(),
-            "EXPERIMENT_NOT_FOUND": lambda _: ObjectNotFound(),
-            "INCORRECT_IDENTIFIER": lambda response_body: IncorrectIdentifierException(
-                identifier=response_body.get("identifier", "<Unknown identifier>")
-            ),
-            "LIMIT_OF_PROJECTS_REACHED": lambda _: ProjectsLimitReached(),
-            "PROJECT_KEY_COLLISION": lambda response_body: ProjectKeyCollision(
-                key=response_body.get("key", "<unknown key>")
-            ),
-            "PROJECT_KEY_INVALID": lambda response_body: ProjectKeyInvalid(
-                key=response_body.get("key", "<unknown key>"),
-                reason=response_body.get("reason", "Unknown reason"),
-            ),
-            "PROJECT_NAME_COLLISION": lambda response_body: ProjectNameCollision(
-                key=response_body.get("key", "<unknown key>")
-            ),
-            "PROJECT_NAME_INVALID": lambda response_body: ProjectNameInvalid(
-                name=response_body.get("name", "<unknown name>")
-            ),
-            "VISIBILITY_RESTRICTED": lambda response_body: ProjectPrivacyRestrictedException(
-                requested=response_body.get("requestedValue"),
-                allowed=response_body.get("allowedValues"),
-            ),
-            "WORKSPACE_IN_READ_ONLY_MODE": lambda response_body: NeptuneLimitExceedException(
-                reason=response_body.get("title", "Unknown reason")
-            ),
-            "PROJECT_LIMITS_EXCEEDED": lambda response_body: NeptuneLimitExceedException(
-                reason=response_body.get("title", "Unknown reason")
-            ),
-            "LIMIT_OF_ACTIVE_PROJECTS_REACHED": lambda response_body: ActiveProjectsLimitReachedException(
-                currentQuota=response_body.get("currentQuota", "<unknown quota>")
-            ),
-            "WRITE_ACCESS_DENIED_TO_ARCHIVED_PROJECT": lambda _: WritingToArchivedProjectException(),
-        }
-
         body = ensure_json_response(response)
         error_type: str | None = body.get("errorType")
-        error_processor = error_processors.get(error_type)
+        error_processor = _get_error_processors().get(error_type)
         if error_processor:
             if exception:
                 raise error_processor(body) from exception
@@ -34,6 +34,7 @@ __all__ = [
     "which_progress_bar",
 ]
 
+from collections import OrderedDict
 import dataclasses
 from functools import (
     lru_cache,
@@ -41,6 +42,8 @@ from functools import (
 )
 import os
 import socket
+import threading
+import time
 from typing import (
     TYPE_CHECKING,
     Callable,
@@ -91,6 +94,13 @@ from minfx.neptune_v2.progress_bar import (
 
 logger = get_logger()
 
+try:
+    import orjson
+
+    ORJSON_INSTALLED = True
+except ImportError:
+    ORJSON_INSTALLED = False
+
 if TYPE_CHECKING:
     from bravado.exception import HTTPError
     from bravado.http_client import HttpClient
@@ -103,12 +113,44 @@ if TYPE_CHECKING:
     from minfx.neptune_v2.internal.backends.neptune_backend import NeptuneBackend
 
 
-@lru_cache(maxsize=None, typed=True)
+# Host -> (expiry on the monotonic clock, whether it resolved), least recently used first
+_HOST_RESOLUTION_CACHE: OrderedDict[str, tuple[float, bool]] = OrderedDict()
+_HOST_RESOLUTION_CACHE_LOCK = threading.Lock()
+_HOST_RESOLUTION_CACHE_MAXSIZE = 256
+_HOST_RESOLUTION_TTL_SECONDS = 300.0
+_HOST_RESOLUTION_FAILURE_TTL_SECONDS = 30.0
+
+
 def verify_host_resolution(url: str) -> None:
+    """Raise CannotResolveHostname if the URL's host does not resolve.
+
+    Results are cached per host, not per URL: successes for a few minutes, failures for
+    half a minute, so a host that comes back is picked up quickly.
+    """
     host = urlparse(url).netloc.split(":")[0]
-    try:
-        socket.gethostbyname(host)
-    except socket.gaierror:
+    now = time.monotonic()
+    with _HOST_RESOLUTION_CACHE_LOCK:
+        cached = _HOST_RESOLUTION_CACHE.get(host)
+        if cached is not None and cached[0] > now:
+            _HOST_RESOLUTION_CACHE.move_to_end(host)
+            resolved = cached[1]
+        else:
+            resolved = None
+
+    if resolved is None:
+        try:
+            socket.gethostbyname(host)
+            resolved = True
+        except socket.gaierror:
+            resolved = False
+        ttl = _HOST_RESOLUTION_TTL_SECONDS if resolved else _HOST_RESOLUTION_FAILURE_TTL_SECONDS
+        with _HOST_RESOLUTION_CACHE_LOCK:
+            _HOST_RESOLUTION_CACHE[host] = (now + ttl, resolved)
+            _HOST_RESOLUTION_CACHE.move_to_end(host)
+            if len(_HOST_RESOLUTION_CACHE) > _HOST_RESOLUTION_CACHE_MAXSIZE:
+                _HOST_RESOLUTION_CACHE.popitem(last=False)
+
+    if not resolved:
         raise CannotResolveHostname(host)
 
 
@@ -119,6 +161,8 @@ uuid_format = SwaggerFormat(
     validate=lambda x: None,
     description="",
 )
+# Shared by every client; bravado only reads it. The config dict itself can't be shared: from_spec mutates it
+_UUID_FORMATS = [uuid_format]
 
 
 @with_api_exceptions_handler
@@ -152,7 +196,7 @@ def create_swagger_client(
             "validate_swagger_spec": False,
             "validate_requests": False,
             "validate_responses": False,
-            "formats": [uuid_format],
+            "formats": _UUID_FORMATS,
         },
     )
 
@@ -192,26 +236,33 @@ def build_operation_url(base_api: str, operation_url: str) -> str:
     return urljoin(base=base_api, url=operation_url)
 
 
+def _log_server_messages(headers: Mapping[str, str]) -> None:
+    info = headers.get("X-Server-Info")
+    if info:
+        logger.info(info)
+    warning = headers.get("X-Server-Warning")
+    if warning:
+        logger.warning(warning)
+    error = headers.get("X-Server-Error")
+    if error:
+        logger.error(error)
+
+
 # TODO print in color once colored exceptions are added
 def handle_server_raw_response_messages(response: Response) -> Response:
     try:
-        info = response.headers.get("X-Server-Info")
-        if info:
-            logger.info(info)
-        warning = response.headers.get("X-Server-Warning")
-        if warning:
-            logger.warning(warning)
-        error = response.headers.get("X-Server-Error")
-        if error:
-            logger.error(error)
-        return response
+        _log_server_messages(response.headers)
     except Exception:
         # any issues with printing server messages should not cause code to fail
-        return response
+        pass
+    return response
 
 
 # TODO print in color once colored exceptions are added
 class NeptuneResponseAdapter(RequestsResponseAdapter):
+    # Server messages are logged once per response, however many body accessors are used
+    _server_messages_handled = False
+
     @property
     def raw_bytes(self) -> bytes:
         self._handle_response()
@@ -224,19 +275,20 @@ class NeptuneResponseAdapter(RequestsResponseAdapter):
 
     def json(self, **kwargs: object) -> Mapping[str, Any]:
         self._handle_response()
+        if ORJSON_INSTALLED and not kwargs:
+            try:
+                return orjson.loads(self._delegate.content)
+            except orjson.JSONDecodeError:
+                # Non-UTF-8 bodies, NaN literals, oversized ints: let requests decode (or fail) as before
+                pass
         return super().json(**kwargs)
 
     def _handle_response(self) -> None:
+        if self._server_messages_handled:
+            return
+        self._server_messages_handled = True
         try:
-            info = self._delegate.headers.get("X-Server-Info")
-            if info:
-                logger.info(info)
-            warning = self._delegate.headers.get("X-Server-Warning")
-            if warning:
-                logger.warning(warning)
-            error = self._delegate.headers.get("X-Server-Error")
-            if error:
-                logger.error(error)
+            _log_server_messages(self._delegate.headers)
         except Exception:
             # any issues with printing server messages should not cause code to fail
             pass
@@ -252,23 +304,35 @@ class MissingApiClient(SwaggerClientWrapper):
         raise NeptuneFeatureNotAvailableException(missing_feature=self.feature_name)
 
 
-# https://stackoverflow.com/a/44776960
-def cache(func: Callable[P, T]) -> Callable[P, T]:
-    """Transform mutable dictionary into immutable before call to lru_cache."""
+def _freeze(value: object) -> object:
+    """Turn a value into a hashable, typed cache key component, freezing dicts recursively.
 
-    class HDict(dict):
-        def __hash__(self) -> int:
-            return hash(frozenset(self.items()))
+    The type is part of the key so that equal values of different types (1, 1.0, True) don't share an entry.
+    """
+    if isinstance(value, dict):
+        return type(value), frozenset((k, _freeze(v)) for k, v in value.items())
+    return type(value), value
 
-    func = lru_cache(maxsize=None, typed=True)(func)
+
+def cache(func: Callable[P, T]) -> Callable[P, T]:
+    """Memoize func, accepting (unhashable) dict arguments by keying on a frozen copy of them."""
+    results: dict[object, T] = {}
 
     @wraps(func)
     def wrapper(*args: object, **kwargs: object) -> T:
-        args = tuple([HDict(arg) if isinstance(arg, dict) else arg for arg in args])
-        kwargs = {k: HDict(v) if isinstance(v, dict) else v for k, v in kwargs.items()}
-        return func(*args, **kwargs)
+        key = (
+            tuple([_freeze(arg) for arg in args]),
+            frozenset([(k, _freeze(v)) for k, v in kwargs.items()]) if kwargs else None,
+        )
+        try:
+            return results[key]
+        except KeyError:
+            pass
+        result = func(*args, **kwargs)
+        results[key] = result
+        return result
 
-    wrapper.cache_clear = func.cache_clear
+    wrapper.cache_clear = results.clear
     return wrapper
 
 
@@ -281,11 +345,11 @@ def ssl_verify() -> bool:
 
 
 def parse_validation_errors(error: HTTPError) -> dict[str, str]:
-    return {
-        f"{error_description.get('errorCode').get('name')}": error_description.get("context", "")
-        for validation_error in error.swagger_result.validationErrors
-        for error_description in validation_error.get("errors")
-    }
+    errors: dict[str, str] = {}
+    for validation_error in error.swagger_result.validationErrors:
+        for error_description in validation_error.get("errors"):
+            errors[str(error_description["errorCode"]["name"])] = error_description.get("context", "")
+    return errors
 
 
 @dataclasses.dataclass
@@ -301,25 +365,31 @@ class ExecuteOperationsBatchingManager:
 
     def get_batch(self, ops: Iterable[Operation]) -> OperationsBatch:
         result = OperationsBatch()
+        ops = ops if isinstance(ops, list) else list(ops)
+
+        # CopyAttribute can be at the start of a batch; leading ones that fail to resolve are dropped
+        start = 0
         for op in ops:
-            if isinstance(op, CopyAttribute):
-                if not result.operations:
-                    try:
-                        # CopyAttribute can be at the start of a batch
-                        result.operations.append(op.resolve(self._backend))
-                    except MetadataInconsistency as e:
-                        result.errors.append(e)
-                        result.dropped_operations_count += 1
-                else:
-                    # cannot have CopyAttribute after any other op in a batch
-                    break
-            else:
-                result.operations.append(op)
+            if not isinstance(op, CopyAttribute):
+                break
+            start += 1
+            try:
+                result.operations.append(op.resolve(self._backend))
+                break
+            except MetadataInconsistency as e:
+                result.errors.append(e)
+                result.dropped_operations_count += 1
+
+        # cannot have CopyAttribute after any other op in a batch; take the rest up to it in one slice
+        stop = next((i for i in range(start, len(ops)) if isinstance(ops[i], CopyAttribute)), len(ops))
+        result.operations.extend(ops[start:stop])
 
         return result
 
 
+@lru_cache(maxsize=None)
 def _check_if_tqdm_installed() -> bool:
+    # Cached: which_progress_bar asks on every download and table fetch, and the answer can't change
     try:
         import tqdm
 
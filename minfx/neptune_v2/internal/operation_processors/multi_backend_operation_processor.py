@@ -201,7 +201,9 @@ class MultiBackendOperationProcessor(OperationProcessor):
             return
 
         try:
-            with ThreadPoolExecutor(max_workers=len(self._processors)) as executor:
+            with ThreadPoolExecutor(
+                max_workers=len(self._processors), thread_name_prefix="multi_backend_wait"
+            ) as executor:
                 futures = [executor.submit(p.wait) for p in self._processors]
                 futures_wait(futures)
         except RuntimeError as e:
@@ -221,7 +223,9 @@ class MultiBackendOperationProcessor(OperationProcessor):
         logger.info(f"Synchronizing {len(self._processors)} backends...")
 
         try:
-            with ThreadPoolExecutor(max_workers=len(self._processors)) as executor:
+            with ThreadPoolExecutor(
+                max_workers=len(self._processors), thread_name_prefix="multi_backend_stop"
+            ) as executor:
                 futures = [executor.submit(p.stop, seconds) for p in self._processors]
                 futures_wait(futures)
         except RuntimeError as e:
@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 __all__ = [
+    "DATACLASS_SLOTS",
     "as_list",
     "base64_decode",
     "base64_encode",
@@ -45,6 +46,7 @@ from glob import glob
 from io import IOBase
 import os
 from pathlib import Path
+import sys
 from typing import (
     Iterable,
     Mapping,
@@ -59,6 +61,9 @@ T = TypeVar("T")
 
 _logger = get_logger()
 
+# `@dataclass(**DATACLASS_SLOTS)` drops the per-instance __dict__ where supported (Python 3.10+)
+DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 def replace_patch_version(version: str) -> str:
     return version[: version.index(".", version.index(".") + 1)] + ".0"
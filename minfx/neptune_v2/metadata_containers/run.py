@@ -356,9 +356,9 @@ class Run(MetadataContainer):
         # Convert api_token to backends format if provided (for backward compatibility)
         # api_token can be comma-separated for multi-backend support
         if api_token is not None and backends is None:
-            from minfx.neptune_v2.internal.backends.backend_config import configs_from_tokens
+            from minfx.neptune_v2.internal.backends.backend_config import configs_from_token_string
 
-            backends = configs_from_tokens(api_token, proxies=proxies)
+            backends = configs_from_token_string(api_token, proxies=proxies)
 
         verify_type("custom_run_id", custom_run_id, (str, type(None)))
         verify_type("mode", mode, (str, type(None)))